@@ -0,0 +1 @@
+"""make benchmark folder a package for coverage."""
@@ -0,0 +1,31 @@
+"""Pytest benchmark session configuration.
+
+The benchmarks only measure the client side of the lib: Earth Engine is initialized offline with the algorithm definitions shipped with the API so no credentials are needed.
+"""
+
+import ee
+import pytest
+from ee import apitestcase
+
+import pygaul
+
+
+def pytest_configure():
+    """Initialize GEE without connecting to the server."""
+    ee.Reset()
+    ee.data._install_cloud_api_resource = lambda: None
+    ee.data.getAlgorithms = apitestcase.GetAlgorithms
+    ee.Initialize(None, "", project="pygaul-benchmark")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def indexes():
+    """Build all the cached indexes before measuring the lookups.
+
+    The memoization of the requests is disabled to measure their computation, see the memo benchmarks.
+    """
+    pygaul.set_cache_size(0)
+    pygaul.Names(name="France")
+    pygaul.resolve(name="France")
+    pygaul.suggest(name="Franc")
+    pygaul.suggest(admin="3010")
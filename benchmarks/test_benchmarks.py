@@ -0,0 +1,109 @@
+"""Benchmarks of the lookups, the Items expressions and the import of the lib."""
+
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+import pygaul
+from pygaul import names
+
+
+@pytest.mark.parametrize("name", ["France", "Auvergne-Rhône-Alpes", "Corse-du-Sud"])
+def test_names_name(benchmark, name):
+    """Exact name hit at each level."""
+    benchmark(pygaul.Names, name=name)
+
+
+def test_names_admin(benchmark):
+    """Admin code hit."""
+    benchmark(pygaul.Names, admin="2968")
+
+
+def test_names_miss(benchmark):
+    """Miss with suggestions in the error message."""
+    benchmark(pytest.raises, ValueError, pygaul.Names, name="Franc")
+
+
+def test_names_content(benchmark):
+    """All the level 2 areas of a country."""
+    benchmark(pygaul.Names, name="France", content_level=2)
+
+
+def test_names_complete(benchmark):
+    """All the level 2 areas of a country with their parents."""
+    benchmark(pygaul.Names, name="France", content_level=2, complete=True)
+
+
+def test_names_world(benchmark):
+    """World listing."""
+    benchmark(pygaul.Names)
+
+
+def test_names_continent(benchmark):
+    """Countries of a continent."""
+    benchmark(pygaul.Names, name="Africa")
+
+
+def test_resolve(benchmark):
+    """Bulk identification of 10 000 names."""
+    values = names._str(names._df().gaul2_name).sample(10000, random_state=0).to_numpy()
+    benchmark(pygaul.resolve, name=values)
+
+
+def test_suggest(benchmark):
+    """Suggestions for a misspelled name."""
+    benchmark(pygaul.suggest, name="palo de faria")
+
+
+def test_items_continent(benchmark):
+    """Build and serialize the expression of a continent."""
+    benchmark(lambda: pygaul.Items(name="Africa").serialize())
+
+
+def test_items_content(benchmark):
+    """Build and serialize the expression of the level 2 areas of a continent."""
+    benchmark(lambda: pygaul.Items(name="Europe", content_level=2).serialize())
+
+
+def test_items_countries(benchmark):
+    """Build the expression of the level 1 areas of 200 countries given by code."""
+    countries = pygaul.Names().gaul0_code.to_list()[:200]
+    benchmark(pygaul.Items, admin=countries, content_level=1)
+
+
+@pytest.mark.parametrize("kind", ["names", "items"])
+def test_memo(benchmark, kind):
+    """Repeated request read from the memo cache."""
+    request = pygaul.Names if kind == "names" else pygaul.Items
+    pygaul.set_cache_size(128)
+    benchmark(request, name="France", content_level=1)
+    pygaul.set_cache_size(0)
+
+
+def test_locate(benchmark):
+    """Locate 100 000 points in a grid of 10 000 areas."""
+    gpd = pytest.importorskip("geopandas")
+    shapely = pytest.importorskip("shapely")
+
+    x, y = np.meshgrid(np.arange(100), np.arange(100))
+    boxes = shapely.box(x.ravel(), y.ravel(), x.ravel() + 1, y.ravel() + 1)
+    grid = gpd.GeoDataFrame({"gaul2_code": np.arange(len(boxes))}, geometry=boxes, crs=4326)
+    locator = pygaul.Locator(level=2, geometries=grid)
+
+    rng = np.random.default_rng(0)
+    lons, lats = rng.uniform(0, 100, 100000), rng.uniform(0, 100, 100000)
+    benchmark(locator.locate, lons, lats)
+
+
+def test_indexes(benchmark):
+    """Build the database and the lookup indexes from scratch."""
+    benchmark.pedantic(
+        pygaul.Names, kwargs={"name": "France"}, setup=pygaul.get_store().clear, rounds=5
+    )
+
+
+def test_import(benchmark):
+    """Import the lib in a fresh interpreter."""
+    benchmark.pedantic(subprocess.run, args=([sys.executable, "-c", "import pygaul"],), rounds=5)
@@ -40,6 +40,14 @@ def dead_fixtures(session: nox.Session):
     session.run("pytest", "--dead-fixtures")
 
 
+@nox.session(reuse_venv=True, venv_backend="uv")
+def benchmark(session: nox.Session):
+    """Run the benchmarks, save them and compare them to the previous saved run."""
+    session.install("-e", ".[test]", "pytest-benchmark")
+    args = session.posargs or ["--benchmark-compare"]
+    session.run("pytest", "benchmarks", "--benchmark-autosave", *args)
+
+
 @nox.session(reuse_venv=True, venv_backend="uv")
 def docs(session: nox.Session):
     """Build the documentation."""
@@ -0,0 +1,95 @@
+"""Local cache of the administrative boundaries downloaded from Earth Engine.
+
+The geometries are stored as one GeoParquet file per area in the cache directory of the lib. The least recently used files are removed when the cache grows bigger than its maximal size.
+"""
+
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Tuple, Union
+
+from deprecated.sphinx import versionadded  # type: ignore [import-untyped]
+
+from . import _cache_dir
+
+if TYPE_CHECKING:
+    import geopandas as gpd
+
+
+@versionadded(version="0.5.0", reason="Add a local cache of the downloaded geometries")
+class GeometryCache:
+    def __init__(self, directory: Union[str, Path] = "", max_size: int = 500):
+        """Size-bounded cache of the administrative boundaries downloaded from Earth Engine.
+
+        Each area is stored in its own GeoParquet file keyed by its level and its GAUL code. Reading a file marks it as recently used (its modification time is updated) so that the least recently used areas are the first ones removed when the cache exceeds its maximal size. The cache can be shared by several processes. This class requires :code:`geopandas`.
+
+        Args:
+            directory: The folder of the cache. Default to the :code:`geometries` folder of the lib cache directory (set with the :code:`PYGAUL_CACHE_DIR` environment variable).
+            max_size: The maximal size of the cache in MB. Default to 500.
+        """
+        self.directory = Path(directory) if directory else _cache_dir() / "geometries"
+        self.max_size = max_size
+        self._lock = threading.Lock()
+
+    def _file(self, level: int, code: int) -> Path:
+        """Get the file of an area."""
+        return self.directory / f"L{level}" / f"{code}.parquet"
+
+    def get(self, level: int, codes: List[int]) -> Tuple[Dict[int, "gpd.GeoDataFrame"], List[int]]:
+        """Read areas from the cache.
+
+        Args:
+            level: The level of the areas.
+            codes: The GAUL codes of the areas.
+
+        Returns:
+            The cached areas by code and the codes missing from the cache.
+        """
+        import geopandas as gpd
+
+        hits, missing = {}, []
+        for code in codes:
+            file = self._file(level, code)
+            try:
+                hits[code] = gpd.read_parquet(file)
+                os.utime(file)
+            except FileNotFoundError:
+                missing.append(code)
+
+        return hits, missing
+
+    def put(self, level: int, gdf: "gpd.GeoDataFrame"):
+        """Add areas to the cache and remove the least recently used ones if needed.
+
+        Args:
+            level: The level of the areas.
+            gdf: The areas with their :code:`gaul{level}_code` column.
+        """
+        for code, area in gdf.groupby(f"gaul{level}_code", sort=False):
+            file = self._file(level, int(code))
+            file.parent.mkdir(parents=True, exist_ok=True)
+
+            # write under a temporary name so that other processes never read a partial file
+            tmp = file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            area.to_parquet(tmp)
+            os.replace(tmp, file)
+
+        self.evict()
+
+    def evict(self):
+        """Remove the least recently used areas until the cache fits in its maximal size."""
+        with self._lock:
+            files = [(f, f.stat()) for f in self.directory.glob("L*/*.parquet")]
+            files.sort(key=lambda f: f[1].st_mtime_ns)
+            size = sum(stat.st_size for _, stat in files)
+            for file, stat in files:
+                if size <= self.max_size * 2**20:
+                    break
+                file.unlink(missing_ok=True)
+                size -= stat.st_size
+
+    def clear(self):
+        """Remove all the areas from the cache."""
+        with self._lock:
+            shutil.rmtree(self.directory, ignore_errors=True)
@@ -0,0 +1,190 @@
+"""Command line interface of the lib.
+
+The :code:`pygaul resolve` command annotates a CSV or Parquet file with the GAUL codes of one of its columns. The file is streamed by chunks so that the memory stays bounded whatever its size, and the chunks can be resolved by several worker processes while the results are written in the order of the input.
+"""
+
+import argparse
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Deque, Iterator, List, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .names import resolve, suggest
+
+
+def _read(file: Path, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """Read a CSV or Parquet file by chunks, the CSV values are kept as strings and the empty chunks are skipped."""
+    if file.suffix == ".parquet":
+        chunks = (b.to_pandas() for b in pq.ParquetFile(file).iter_batches(batch_size=chunk_size))
+    else:
+        chunks = pd.read_csv(file, dtype=str, keep_default_na=False, chunksize=chunk_size)
+
+    yield from (chunk for chunk in chunks if len(chunk) > 0)
+
+
+def _header(file: Path) -> pd.DataFrame:
+    """Read the columns of a CSV or Parquet file without any row."""
+    if file.suffix == ".parquet":
+        return pq.read_schema(file).empty_table().to_pandas()
+
+    return pd.read_csv(file, dtype=str, keep_default_na=False, nrows=0)
+
+
+def _annotate(chunk: pd.DataFrame, column: str, is_name: bool, n: int) -> pd.DataFrame:
+    """Add the level, the names and codes of the hierarchy and the status of the values of a column.
+
+    Each distinct value of the chunk is resolved once and the values that are not found get the :code:`n` closest names or codes of the database (separated by :code:`|`).
+    """
+    key = "name" if is_name else "admin"
+    values = chunk[column]
+
+    # the integer codes of a column with nulls are read as floats, they are written without decimals
+    if pd.api.types.is_float_dtype(values) and (values.dropna() % 1 == 0).all():
+        values = values.astype("Int64")
+    values = values.astype(str).where(values.notna(), "")
+
+    codes, uniques = pd.factorize(values)
+    result = resolve(**{key: uniques.to_numpy()})
+
+    if n > 0:
+        result["suggestions"] = ""
+        missing = result.index[(result.status == "not found").to_numpy() & (uniques != "")]
+        suggestions = ["|".join(suggest(**{key: uniques[i], "n": n})) for i in missing]
+        result.loc[missing, "suggestions"] = suggestions
+
+    result = result.drop(columns=key).take(codes)
+    result.index = chunk.index
+    return chunk.assign(**{c: result[c] for c in result.columns})
+
+
+class _Writer:
+    """Write the annotated chunks one after the other in a CSV or Parquet file."""
+
+    def __init__(self, file: Path):
+        self.file, self.header = file, True
+        self.writer: Optional[pq.ParquetWriter] = None
+
+    def write(self, chunk: pd.DataFrame):
+        if self.file.suffix == ".parquet":
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if self.writer is None:
+                self.writer = pq.ParquetWriter(self.file, table.schema)
+            self.writer.write_table(table.cast(self.writer.schema))
+        else:
+            chunk.to_csv(
+                self.file, mode="w" if self.header else "a", header=self.header, index=False
+            )
+            self.header = False
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+def _resolve_file(args: argparse.Namespace) -> int:
+    """Run the resolve command."""
+    is_name, start, rows = args.admin is False, time.perf_counter(), 0
+    chunks = _read(Path(args.input), args.chunk_size)
+    writer = _Writer(Path(args.output))
+
+    def report(chunk: pd.DataFrame):
+        nonlocal rows
+        writer.write(chunk)
+        rows += len(chunk)
+        if not args.quiet:
+            rate = rows / max(time.perf_counter() - start, 1e-9)
+            print(f"{rows} rows resolved ({rate:.0f} rows/s)", file=sys.stderr)
+
+    try:
+        if args.workers <= 1:
+            for chunk in chunks:
+                report(_annotate(chunk, args.column, is_name, args.suggestions))
+        else:
+            # at most 2 chunks per worker are read ahead to keep the memory bounded
+            with ProcessPoolExecutor(max_workers=args.workers) as executor:
+                pending: Deque[Future] = deque()
+                for chunk in chunks:
+                    pending.append(
+                        executor.submit(_annotate, chunk, args.column, is_name, args.suggestions)
+                    )
+                    if len(pending) >= 2 * args.workers:
+                        report(pending.popleft().result())
+                while pending:
+                    report(pending.popleft().result())
+
+        # an input without rows still gives an output file with the result columns
+        if rows == 0:
+            writer.write(
+                _annotate(_header(Path(args.input)), args.column, is_name, args.suggestions)
+            )
+    finally:
+        writer.close()
+
+    if not args.quiet:
+        duration = time.perf_counter() - start
+        print(
+            f"{rows} rows written to {args.output} in {duration:.1f}s "
+            f"({rows / max(duration, 1e-9):.0f} rows/s)",
+            file=sys.stderr,
+        )
+
+    return 0
+
+
+def _parser() -> argparse.ArgumentParser:
+    """Build the parser of the command line."""
+    parser = argparse.ArgumentParser(
+        prog="pygaul", description="Tools for the FAO GAUL administrative areas."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    command = commands.add_parser(
+        "resolve",
+        help="Add the GAUL codes of a column of names or codes to a CSV or Parquet file.",
+        description="Add the level, the names and codes of the hierarchy, the status and the suggestions of each value of a column to a CSV or Parquet file (chosen from the file extensions).",
+    )
+    command.add_argument("input", help="The CSV or Parquet file to annotate.")
+    command.add_argument("output", help="The annotated CSV or Parquet file.")
+    command.add_argument("-c", "--column", required=True, help="The column to resolve.")
+    command.add_argument(
+        "--admin", action="store_true", help="The column holds GAUL codes instead of names."
+    )
+    command.add_argument(
+        "--chunk-size", type=int, default=100000, help="The number of rows resolved at once."
+    )
+    command.add_argument(
+        "-w", "--workers", type=int, default=1, help="The number of worker processes."
+    )
+    command.add_argument(
+        "--suggestions",
+        type=int,
+        default=3,
+        help="The number of suggestions for the values that are not found, 0 to skip them.",
+    )
+    command.add_argument("-q", "--quiet", action="store_true", help="Do not report the progress.")
+    command.set_defaults(run=_resolve_file)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the command line interface.
+
+    Args:
+        argv: The arguments of the command. Default to the arguments of the process.
+
+    Returns:
+        The exit code of the command.
+    """
+    args = _parser().parse_args(argv)
+    return args.run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,264 @@
+"""Download engine of the administrative boundaries from Earth Engine.
+
+A single :code:`getInfo` call on a large collection hits the payload limits of the Earth Engine API and sequential calls are slow. The requested codes are thus split in chunks downloaded concurrently, the chunks that are still too big for the server being split again.
+"""
+
+import json
+import os
+import re
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union, cast
+
+import ee
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import shapely
+from deprecated.sphinx import versionadded  # type: ignore [import-untyped]
+
+from .items import _collection
+from .tracing import span
+
+_PAYLOAD_ERROR = re.compile(r"payload|accumulating over|memory limit", re.IGNORECASE)
+"Messages of the Earth Engine errors raised when a request is too big."
+
+_FORMATS = {
+    ".parquet": "parquet",
+    ".geoparquet": "parquet",
+    ".geojson": "geojson",
+    ".json": "geojson",
+    ".shp": "shapefile",
+    ".gpkg": "gpkg",
+}
+"The export formats associated to the file extensions."
+
+_DRIVERS = {"geojson": "GeoJSON", "shapefile": "ESRI Shapefile", "gpkg": "GPKG"}
+"The OGR drivers of the export formats written by geopandas."
+
+
+def _request(level: int, codes: List[int], delay: float = 0, max_error: float = 0) -> List[dict]:
+    """Wait for the given delay and request the features of some areas, simplified by Earth Engine if a max error is set."""
+    time.sleep(delay)
+    collection = _collection(level, codes)
+    if max_error > 0:
+        collection = collection.map(lambda feature: feature.simplify(maxError=max_error))
+
+    with span("pygaul.ee", level=level, codes=len(codes)):
+        # a feature collection is always computed to a dict
+        return cast(dict, collection.getInfo())["features"]
+
+
+def _iter_chunks(
+    level: int,
+    codes: List[int],
+    chunk_size: int = 100,
+    workers: int = 4,
+    retries: int = 3,
+    backoff: float = 1.0,
+    max_error: float = 0,
+) -> Iterator[Tuple[List[int], List[dict]]]:
+    """Download the features of some areas by chunks, see :py:func:`download` for the parameters.
+
+    Yields:
+        The codes of each chunk and their features, in the order the chunks finish.
+    """
+    chunks = [codes[i : i + chunk_size] for i in range(0, len(codes), chunk_size)]
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        pending: Dict[Future, Tuple[List[int], int]] = {
+            executor.submit(_request, level, c, 0, max_error): (c, 0) for c in chunks
+        }
+        while pending:
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                chunk, attempt = pending.pop(future)
+                try:
+                    features = future.result()
+                except ee.EEException as e:
+                    if _PAYLOAD_ERROR.search(str(e)) and len(chunk) > 1:
+                        half = len(chunk) // 2
+                        for c in [chunk[:half], chunk[half:]]:
+                            pending[executor.submit(_request, level, c, 0, max_error)] = (
+                                c,
+                                attempt,
+                            )
+                    elif attempt < retries:
+                        delay = backoff * 2**attempt
+                        retry = executor.submit(_request, level, chunk, delay, max_error)
+                        pending[retry] = (chunk, attempt + 1)
+                    else:
+                        raise
+                    continue
+
+                yield chunk, features
+    finally:
+        # the chunks that are not started are dropped if the download is interrupted
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+@versionadded(version="0.5.0", reason="Add a concurrent download engine")
+def download(
+    level: int,
+    codes: List[int],
+    chunk_size: int = 100,
+    workers: int = 4,
+    retries: int = 3,
+    backoff: float = 1.0,
+    progress: Optional[Callable[[int, int], None]] = None,
+    max_error: float = 0,
+) -> gpd.GeoDataFrame:
+    """Download the features of some areas from Earth Engine.
+
+    The codes are split in chunks requested concurrently by a bounded pool of threads. A chunk rejected because the response is too big is split in two, other Earth Engine errors are retried with an exponential backoff.
+
+    Args:
+        level: The level of the areas.
+        codes: The GAUL codes of the areas.
+        chunk_size: The maximal number of areas requested in a single call. Default to 100.
+        workers: The maximal number of concurrent calls. Default to 4.
+        retries: The number of times a failing chunk is requested again before raising the error. Default to 3.
+        backoff: The delay in seconds before the first retry, doubled for each new attempt. Default to 1.
+        progress: A function called with the number of downloaded areas and the total number of areas each time a chunk is downloaded.
+        max_error: The maximal error in meters of the geometries simplified by Earth Engine before the transfer. Default to 0 (exact geometries).
+
+    Returns:
+        The features of the areas in EPSG:4326, sorted in the requested order.
+    """
+    features: List[dict] = []
+    done = 0
+    for chunk, chunk_features in _iter_chunks(
+        level, codes, chunk_size, workers, retries, backoff, max_error
+    ):
+        features += chunk_features
+        done += len(chunk)
+        if progress is not None:
+            progress(done, len(codes))
+
+    # the chunks are finishing in any order, the areas of a requested parent that are missing from
+    # the local database (the asset can differ from it) are kept at the end
+    gdf = gpd.GeoDataFrame.from_features(features, crs="EPSG:4326")
+    if len(gdf) > 0:
+        order = {c: i for i, c in enumerate(codes)}
+        keys = [order.get(c, len(order)) for c in gdf[f"gaul{level}_code"]]
+        gdf = gdf.iloc[np.argsort(keys, kind="stable")]
+
+    return gdf.reset_index(drop=True)
+
+
+def _widen(field: pa.Field) -> pa.Field:
+    """Get the type of a column able to hold the values of the next chunks.
+
+    The columns without any value in the first chunk are strings and the integer properties are floats, only the GAUL codes are always integers.
+    """
+    if pa.types.is_null(field.type):
+        return field.with_type(pa.string())
+    if pa.types.is_integer(field.type) and not re.fullmatch(r"gaul\d_code", field.name):
+        return field.with_type(pa.float64())
+
+    return field
+
+
+class _GeoParquetWriter:
+    """Write GeoDataFrames one after the other as the row groups of a GeoParquet file.
+
+    The schema is the one of the first frame with widened types (see :py:func:`_widen`): the missing columns of the next ones are set to null and their extra columns are dropped. The geometries are encoded in WKB. The file is written under a temporary name and moved when it is closed so that a partial file is never read.
+    """
+
+    def __init__(self, file: Path):
+        self.file = file
+        self.writer: Optional[pq.ParquetWriter] = None
+        self.tmp = file.with_name(f".{file.name}.{os.getpid()}.tmp")
+
+    def write(self, gdf: gpd.GeoDataFrame):
+        df = pd.DataFrame(gdf.drop(columns=gdf.geometry.name))
+        df["geometry"] = shapely.to_wkb(gdf.geometry.to_numpy())
+
+        if self.writer is None:
+            geo = {
+                "version": "1.0.0",
+                "primary_column": "geometry",
+                "columns": {
+                    "geometry": {
+                        "encoding": "WKB",
+                        "geometry_types": [],
+                        "crs": gdf.crs.to_json_dict(),
+                    }
+                },
+            }
+            fields = [_widen(f) for f in pa.Schema.from_pandas(df, preserve_index=False)]
+            schema = pa.schema(fields, metadata={b"geo": json.dumps(geo).encode()})
+            self.writer = pq.ParquetWriter(self.tmp, schema)
+
+        schema = self.writer.schema
+        df = df.reindex(columns=schema.names)
+        self.writer.write_table(pa.Table.from_pandas(df, schema=schema, preserve_index=False))
+
+    def close(self):
+        if self.writer is None:
+            gpd.GeoDataFrame(geometry=[], crs="EPSG:4326").to_parquet(self.tmp)
+        else:
+            self.writer.close()
+        os.replace(self.tmp, self.file)
+
+    def abort(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.tmp.unlink(missing_ok=True)
+
+
+def _export(
+    codes: Dict[int, List[int]],
+    path: Union[str, Path],
+    format: str = "",
+    chunk_size: int = 100,
+    workers: int = 4,
+    retries: int = 3,
+    max_error: float = 0,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> Path:
+    """Download the features of some areas to a file, see :py:meth:`Items.export` for the parameters."""
+    file = Path(path)
+    format = (format or _FORMATS.get(file.suffix.lower(), "")).lower()
+    if format != "parquet" and format not in _DRIVERS:
+        raise ValueError(
+            f'Cannot export to "{file.name}": set the format to one of '
+            f"{', '.join(['parquet', *_DRIVERS])}."
+        )
+
+    file.parent.mkdir(parents=True, exist_ok=True)
+    writer = _GeoParquetWriter(file) if format == "parquet" else None
+    total, done, frames = sum(len(c) for c in codes.values()), 0, []
+
+    # the deepest level goes first as its features have the columns of all the levels
+    try:
+        for level in sorted(codes, reverse=True):
+            for chunk, features in _iter_chunks(
+                level, codes[level], chunk_size, workers, retries, max_error=max_error
+            ):
+                if len(features) > 0:
+                    gdf = gpd.GeoDataFrame.from_features(features, crs="EPSG:4326")
+                    if writer is None:
+                        frames.append(gdf)
+                    else:
+                        writer.write(gdf)
+                done += len(chunk)
+                if progress is not None:
+                    progress(done, total)
+    except BaseException:
+        if writer is not None:
+            writer.abort()
+        raise
+
+    # the other formats are written at once by geopandas
+    if writer is None:
+        gdf = pd.concat(frames, ignore_index=True) if frames else gpd.GeoDataFrame(geometry=[])
+        gpd.GeoDataFrame(gdf, crs="EPSG:4326").to_file(file, driver=_DRIVERS[format])
+    else:
+        writer.close()
+
+    return file
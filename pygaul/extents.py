@@ -0,0 +1,203 @@
+"""Bounding boxes and centroids of the administrative areas.
+
+The extents are a small table (one line per GAUL code) built from the boundaries of the areas. They are indexed in memory by level, sorted by their western bound, so that the areas overlapping a bounding box or close to a point are found locally without any Earth Engine call.
+"""
+
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+from deprecated.sphinx import versionadded  # type: ignore [import-untyped]
+
+from . import __gaul_data__, __version__, _cache_dir
+from .store import stored
+from .tracing import traced
+
+if TYPE_CHECKING:
+    import geopandas as gpd
+
+_EARTH_RADIUS = 6371.0088
+"The mean radius of the Earth in km."
+
+_COLUMNS = ["code", "level", "minx", "miny", "maxx", "maxy", "cx", "cy"]
+"The columns of the extents table: the bounding box and the centroid of each area."
+
+
+def _extents_file() -> Path:
+    """Get the extents table: the bundled one if any, else the one built in the cache directory."""
+    bundled = __gaul_data__.with_name("gaul_extents.parquet")
+    return bundled if bundled.exists() else _cache_dir() / f"gaul_extents-{__version__}.parquet"
+
+
+def _extents() -> Dict[int, Dict[str, np.ndarray]]:
+    """Get the extents of the areas of each level as arrays sorted by their western bound.
+
+    They are kept in the store in use (see :py:class:`GaulStore`) and read again when the extents file changes.
+    """
+    file = _extents_file()
+    if not file.exists():
+        raise ValueError(
+            f"The extents of the areas are not available ({file} is missing). "
+            "Build them once with `pygaul.build_extents()`."
+        )
+
+    return _read_extents(str(file), file.stat().st_mtime_ns)
+
+
+@stored
+@traced("pygaul.index.extents")
+def _read_extents(file: str, mtime: int) -> Dict[int, Dict[str, np.ndarray]]:
+    """Read an extents file, keyed by its path and modification time."""
+    df = pd.read_parquet(file, columns=_COLUMNS).sort_values(["level", "minx"])
+    return {
+        int(level): {c: g[c].to_numpy() for c in _COLUMNS[:1] + _COLUMNS[2:]}
+        for level, g in df.groupby("level")
+    }
+
+
+def _in_bbox(level: int, bbox: Sequence[float]) -> np.ndarray:
+    """Find the areas of a level overlapping a bounding box.
+
+    Args:
+        level: The level of the areas.
+        bbox: The bounding box as (minx, miny, maxx, maxy) in EPSG:4326. A box crossing the antimeridian has minx > maxx.
+
+    Returns:
+        The positions of the areas in the extents arrays of the level.
+    """
+    minx, miny, maxx, maxy = bbox
+    if minx > maxx:
+        east, west = (
+            _in_bbox(level, (minx, miny, 180, maxy)),
+            _in_bbox(level, (-180, miny, maxx, maxy)),
+        )
+        return np.union1d(east, west)
+
+    # the areas starting east of the box are skipped without being compared
+    extents = _extents()[level]
+    stop = np.searchsorted(extents["minx"], maxx, side="right")
+    overlap = (
+        (extents["maxx"][:stop] >= minx)
+        & (extents["miny"][:stop] <= maxy)
+        & (extents["maxy"][:stop] >= miny)
+    )
+    return np.flatnonzero(overlap)
+
+
+def _around(level: int, lon: float, lat: float, radius: float) -> np.ndarray:
+    """Find the areas of a level with a bounding box closer than a radius to a point.
+
+    Args:
+        level: The level of the areas.
+        lon: The longitude of the point.
+        lat: The latitude of the point.
+        radius: The radius in km.
+
+    Returns:
+        The positions of the areas in the extents arrays of the level.
+    """
+    # the candidates are the areas overlapping the bounding box of the circle
+    dlat = np.degrees(radius / _EARTH_RADIUS)
+    cos = np.cos(np.radians(min(abs(lat) + dlat, 90)))
+    dlon = 180 if cos < 1e-6 else min(np.degrees(radius / _EARTH_RADIUS / cos), 180)
+    if dlon >= 180:
+        minx, maxx = -180.0, 180.0
+    else:
+        minx, maxx = (lon - dlon + 180) % 360 - 180, (lon + dlon + 180) % 360 - 180
+    index = _in_bbox(level, (minx, max(lat - dlat, -90), maxx, min(lat + dlat, 90)))
+
+    # haversine distance between the point and the closest point of each box
+    extents = _extents()[level]
+    x = np.clip(lon, extents["minx"][index], extents["maxx"][index])
+    y = np.clip(lat, extents["miny"][index], extents["maxy"][index])
+    lon1, lat1, lon2, lat2 = map(np.radians, [lon, lat, x, y])
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    )
+    distance = 2 * _EARTH_RADIUS * np.arcsin(np.sqrt(a))
+
+    return index[distance <= radius]
+
+
+def _spatial_filter(
+    level: int,
+    bbox: Optional[Sequence[float]] = None,
+    around: Optional[Sequence[float]] = None,
+) -> np.ndarray:
+    """Get the codes of the areas of a level matching a bounding box and/or a radius around a point.
+
+    Args:
+        level: The level of the areas.
+        bbox: The bounding box as (minx, miny, maxx, maxy) in EPSG:4326.
+        around: The point and the radius as (lon, lat, km).
+
+    Returns:
+        The GAUL codes of the areas.
+    """
+    if level not in _extents():
+        raise ValueError(f"The extents of the level {level} areas are not available.")
+
+    index = np.arange(len(_extents()[level]["code"]))
+    if bbox is not None:
+        index = np.intersect1d(index, _in_bbox(level, bbox))
+    if around is not None:
+        index = np.intersect1d(index, _around(level, *around))
+
+    return _extents()[level]["code"][index]
+
+
+@versionadded(version="0.5.0", reason="Add the extents of the areas to filter them locally")
+def build_extents(
+    geometries: Optional[Dict[int, Union[str, Path, "gpd.GeoDataFrame"]]] = None,
+) -> Path:
+    """Compute the bounding box and the centroid of every area and store them in the cache directory.
+
+    The extents are computed from the boundaries of each level: the ones given in :code:`geometries` or the ones of the whole world downloaded with :py:meth:`Items.to_geodataframe` using the geometry cache. They only need to be built once per version of the lib. This function requires :code:`geopandas`.
+
+    Args:
+        geometries: The boundaries by level, as GeoDataFrames or files readable by geopandas with a :code:`gaul{level}_code` column. Default to the downloaded boundaries of the 3 levels.
+
+    Returns:
+        The path to the extents table.
+    """
+    import geopandas as gpd
+    import shapely
+
+    from .items import Items
+    from .names import Names
+
+    if geometries is None:
+        countries = Names().gaul0_code.to_list()
+        geometries = {
+            level: Items(admin=countries, content_level=level).to_geodataframe(cache=True)
+            for level in range(3)
+        }
+
+    frames = []
+    for level, gdf in geometries.items():
+        if not isinstance(gdf, gpd.GeoDataFrame):
+            file = Path(gdf)
+            gdf = gpd.read_parquet(file) if file.suffix == ".parquet" else gpd.read_file(file)
+        gdf = gdf.to_crs(4326) if gdf.crs else gdf
+
+        # an area can be split in several features
+        gdf = gdf.dissolve(f"gaul{level}_code", as_index=False)
+        bounds = shapely.bounds(gdf.geometry.to_numpy())
+        centroids = shapely.centroid(gdf.geometry.to_numpy())
+        df = pd.DataFrame(bounds, columns=["minx", "miny", "maxx", "maxy"])
+        df.insert(0, "code", gdf[f"gaul{level}_code"].to_numpy(dtype=np.int64))
+        df.insert(1, "level", level)
+        df["cx"], df["cy"] = shapely.get_x(centroids), shapely.get_y(centroids)
+        frames.append(df)
+
+    # write under a temporary name so that other processes never read a partial file
+    file = _cache_dir() / f"gaul_extents-{__version__}.parquet"
+    file.parent.mkdir(parents=True, exist_ok=True)
+    tmp = file.with_suffix(f".{os.getpid()}.tmp")
+    pd.concat(frames, ignore_index=True)[_COLUMNS].to_parquet(tmp)
+    os.replace(tmp, file)
+
+    return file
@@ -0,0 +1,358 @@
+"""Administrative boundaries of the FAO GAUL database as Earth Engine objects.
+
+This is the only module of the lib importing the Earth Engine Python API.
+"""
+
+import asyncio
+import os
+import warnings
+import weakref
+from collections import Counter
+from concurrent.futures import Executor
+from itertools import product
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple, Union, cast
+
+import ee
+import pandas as pd
+from deprecated.sphinx import deprecated, versionadded  # type: ignore [import-untyped]
+
+from . import __gaul_asset__
+from .memo import _MEMOS, _normalize
+from .names import _area, _continents, _tree
+from .store import _state
+from .tracing import span, traced
+
+if TYPE_CHECKING:
+    import geopandas as gpd
+
+    from .cache import GeometryCache
+
+
+@versionadded(version="0.3.1", reason="Add an Items class to handle admin items")
+class Items(ee.FeatureCollection):
+    def __init__(
+        self,
+        name: Union[str, List[str]] = "",
+        admin: Union[str, List[str]] = "",
+        content_level: int = -1,
+    ):
+        """Object to handle administrative boundaries using the name or the administrative code.
+
+        Return an ee.FeatureCollection representing an administrative region. The region can be requested either by its "name" or its "admin", the lib will identify the area level on the fly. The user can also request for a specific level for the GeoDataFrame features e.g. get all admin level 1 of a country. If nothing is set we will infer the level of the item and if the level is higher than the found item, it will be ignored. If Nothing is found the method will return an error.
+
+        Args:
+            name: The name of an administrative area. Cannot be set along with :code:`admin`. it can be a list or a single name.
+            admin: The id of an administrative area in the GADM nomenclature. Cannot be set along with :code:`name`. It can be a list or a single admin code.
+            content_level: The level to use in the final dataset. Default to -1 (use level from the area).
+        """
+        # set up the loop
+        names = [name] if isinstance(name, str) else name
+        admins = [admin] if isinstance(admin, str) else admin
+
+        # the expression and the codes of a request are reused when it is made again
+        # with the same state of the store
+        state = _state()
+        key = (tuple(map(_normalize, names)), tuple(map(_normalize, admins)), int(content_level))
+        feature_collection, codes, messages = _MEMOS["items"].get(
+            (*key, state.token), lambda: state.call(self._build, names, admins, content_level)
+        )
+        for message in messages:
+            warnings.warn(message)
+
+        self._codes = {level: list(ids) for level, ids in codes.items()}
+
+        super().__init__(feature_collection)
+
+    @traced("pygaul.items")
+    def _build(
+        self, names: List[str], admins: List[str], content_level: int
+    ) -> Tuple[ee.FeatureCollection, Dict[int, List[int]], List[str]]:
+        """
+        Build the expression of the requested administrative boundaries.
+
+        Args:
+            names: The names of the administrative areas.
+            admins: The ids of the administrative areas in the FAO GAUL nomenclature.
+            content_level: The level to use in the final dataset.
+
+        Returns:
+            The feature collection, the requested codes by level and the warnings raised by the request.
+        """
+        # check that they are not all empty
+        if names == [""] == admins:
+            raise ValueError('at least "name" or "admin" need to be set.')
+
+        # use itertools, normally one of them is empty so it will raise an error
+        # if not the case as admin and name will be set together
+        # special parsing for continents. They are associated to the countries by FAO.
+        requests: List[Tuple[str, str]] = []
+        for n, a in product(names, admins):
+            if n and not a and (c := _normalize(n)) in _continents():
+                requests += [("", str(code)) for code in _continents()[c].tolist()]
+            else:
+                requests.append((n, a))
+
+        # the codes are gathered by level to request each GAUL asset only once
+        codes: Dict[int, List[int]] = {}
+        messages: List[str] = []
+        for n, a in requests:
+            level, ids, item_messages = self._items(n, a, content_level)
+            codes.setdefault(level, []).extend(ids)
+            messages += item_messages
+
+        # duplicated codes are removed keeping the request order
+        codes = {level: list(dict.fromkeys(ids)) for level, ids in sorted(codes.items())}
+
+        # read the accurate datasets
+        fc_list = [_collection(level, ids) for level, ids in codes.items()]
+
+        # concat all the data (at most one collection per level)
+        feature_collection = fc_list[0]
+        if len(fc_list) > 1:
+            for fc in fc_list[1:]:
+                feature_collection = feature_collection.merge(fc)
+
+        return feature_collection, codes, messages
+
+    def _items(
+        self, name: str = "", admin: str = "", content_level: int = -1
+    ) -> Tuple[int, List[int], List[str]]:
+        """
+        Return the codes of the requested administrative boundaries from a single name or administrative code.
+
+        Args:
+            name: The name of an administrative area. Cannot be set along with :code:`admin`.
+            admin: The id of an administrative area in the FAO GAUL nomenclature. Cannot be set along with :code:`name`.
+            content_level: The level to use in the final dataset. Default to -1 (use level from the area).
+
+        Returns:
+            The level of the requested boundaries, their GAUL codes and the warnings raised by the request.
+        """
+        # the area is resolved once to check its uniqueness and to get the codes of its content
+        if not (name or admin):
+            raise ValueError('at least "name" or "admin" need to be set.')
+        area = _area(name, admin)
+        if len(area.layers[0]) > 1:
+            raise ValueError(
+                f'The requested name ("{name}") is not unique ({len(area.layers[0])} results). '
+                f"To retrieve it, please use the `admin` parameter instead. "
+                f"If you don't know the GAUL code, use the following code, "
+                f'it will return the GAUL codes as well:\n`Names(name="{name}")`'
+            )
+
+        content_level, messages = area.content_level(content_level)
+        ids = area.codes(content_level).tolist()
+
+        return content_level, ids, messages
+
+    @versionadded(version="0.5.0", reason="Add a method to download the boundaries")
+    def to_geodataframe(
+        self,
+        cache: Union[bool, "GeometryCache"] = False,
+        chunk_size: int = 100,
+        workers: int = 4,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> "gpd.GeoDataFrame":
+        """Download the administrative boundaries as a GeoDataFrame.
+
+        The features are downloaded concurrently by chunks of areas (see :py:func:`pygaul.download.download`). If a cache is used, the areas already downloaded are read from the local files and only the missing ones are requested (and then added to the cache). This method requires :code:`geopandas`.
+
+        Args:
+            cache: Set to True to use the default :py:class:`GeometryCache` or pass a configured one. Default to False (download everything).
+            chunk_size: The maximal number of areas requested in a single call. Default to 100.
+            workers: The maximal number of concurrent calls. Default to 4.
+            progress: A function called with the number of downloaded areas and the total number of areas to download each time a chunk is downloaded.
+
+        Returns:
+            The boundaries with all the GAUL attributes in EPSG:4326, sorted by level and in the requested order.
+        """
+        from .cache import GeometryCache
+        from .download import download
+
+        cache = GeometryCache() if cache is True else cache
+
+        # read the cached areas first to know how many need to be downloaded
+        requests = {lvl: cache.get(lvl, c) if cache else ({}, c) for lvl, c in self._codes.items()}
+        total, offset = sum(len(missing) for _, missing in requests.values()), 0
+
+        frames = []
+        for level, (hits, missing) in requests.items():
+            if len(missing) > 0:
+                callback = (
+                    None if progress is None else lambda d, _, o=offset: progress(o + d, total)
+                )
+                gdf = download(level, missing, chunk_size, workers, progress=callback)
+                if len(gdf) > 0:
+                    if cache:
+                        cache.put(level, gdf)
+                    groups = gdf.groupby(f"gaul{level}_code", sort=False)
+                    hits.update({int(c): a for c, a in groups})
+                offset += len(missing)
+            frames += [hits[c] for c in self._codes[level] if c in hits]
+
+        # Earth Engine can return no feature for the requested codes
+        if len(frames) == 0:
+            import geopandas as gpd
+
+            return gpd.GeoDataFrame(geometry=[], crs="EPSG:4326")
+
+        return pd.concat(frames, ignore_index=True)
+
+    @versionadded(version="0.5.0", reason="Add a method to export the boundaries to files")
+    def export(
+        self,
+        path: Union[str, Path],
+        format: str = "",
+        chunk_size: int = 100,
+        workers: int = 4,
+        max_error: float = 0,
+        retries: int = 3,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> Path:
+        """Download the administrative boundaries to a local file.
+
+        The areas are split in chunks of GAUL codes downloaded concurrently and retried on errors (see :py:func:`pygaul.download.download`). A GeoParquet file is streamed: each chunk is written as a row group as soon as it is downloaded so that the memory only holds the chunks in flight, and the rows are in the order the chunks finish. The other formats are written by geopandas once all the chunks are downloaded. This method requires :code:`geopandas`.
+
+        Args:
+            path: The file to write.
+            format: The format of the file, one of :code:`"parquet"`, :code:`"geojson"`, :code:`"shapefile"` or :code:`"gpkg"`. Default to the one of the file extension.
+            chunk_size: The maximal number of areas requested in a single call. Default to 100.
+            workers: The maximal number of concurrent calls. Default to 4.
+            max_error: The maximal error in meters of the geometries simplified by Earth Engine before the transfer. Default to 0 (exact geometries).
+            retries: The number of times a failing chunk is requested again before raising the error. Default to 3.
+            progress: A function called with the number of downloaded areas and the total number of areas each time a chunk is downloaded.
+
+        Returns:
+            The path to the written file.
+        """
+        from .download import _export
+
+        return _export(self._codes, path, format, chunk_size, workers, retries, max_error, progress)
+
+    @versionadded(version="0.5.0", reason="Add an async API to request the boundaries")
+    async def fetch_async(self, executor: Optional[Executor] = None) -> dict:
+        """Request the administrative boundaries without blocking the event loop.
+
+        The :code:`getInfo` call is run in an executor. The number of calls in flight in an event loop is limited by the :code:`PYGAUL_ASYNC_LIMIT` environment variable (default to 8), the other ones wait for a slot. If the awaiting task is cancelled before its call started, the call is never sent to Earth Engine.
+
+        Args:
+            executor: The executor running the call. Default to the executor of the event loop.
+
+        Returns:
+            The boundaries as a GeoJSON FeatureCollection dictionary.
+        """
+        async with _semaphore():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, self._get_info)
+
+    def _get_info(self) -> dict:
+        """Request the features of the collection from Earth Engine."""
+        with span("pygaul.ee", codes=sum(len(c) for c in self._codes.values())):
+            # a feature collection is always computed to a dict
+            return cast(dict, self.getInfo())
+
+
+_SEMAPHORES: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+"The semaphores limiting the Earth Engine calls in flight of each event loop."
+
+
+def _semaphore() -> asyncio.Semaphore:
+    """Get the semaphore of the running event loop."""
+    loop = asyncio.get_running_loop()
+    if loop not in _SEMAPHORES:
+        _SEMAPHORES[loop] = asyncio.Semaphore(int(os.environ.get("PYGAUL_ASYNC_LIMIT", 8)))
+
+    return _SEMAPHORES[loop]
+
+
+def _groups(level: int, codes: List[int]) -> Dict[int, List[int]]:
+    """Group the codes of some areas by the parents they fully cover.
+
+    The areas including all the areas of the level of a parent are replaced by the code of this parent, starting from the countries so that a whole country is requested by its code instead of the codes of all its regions.
+
+    Args:
+        level: The level of the areas.
+        codes: The GAUL codes of the areas.
+
+    Returns:
+        The codes to use for each level: the fully covered parents and the remaining areas (in the key of their own level). The empty levels are skipped.
+    """
+    levels, _, parent_codes, children = _tree()
+    remaining, groups = list(dict.fromkeys(codes)), {}
+
+    for parent_level in range(level):
+        ancestors = remaining
+        for _ in range(level - parent_level):
+            ancestors = [parent_codes.get(c, -1) for c in ancestors]
+
+        # a parent is covered when all its areas of the requested level are requested
+        counts = Counter(ancestors)
+        whole = []
+        for parent, count in counts.items():
+            if parent == -1 or levels.get(parent) != parent_level:
+                continue
+            content = [parent]
+            for _ in range(level - parent_level):
+                content = [c for p in content for c in children.get(p, ())]
+            if count == len(content):
+                whole.append(parent)
+
+        if whole:
+            groups[parent_level] = whole
+            covered = set(whole)
+            remaining = [c for c, a in zip(remaining, ancestors) if a not in covered]
+
+    if remaining or not groups:
+        groups[level] = remaining
+
+    return groups
+
+
+def _collection(level: int, codes: List[int]) -> ee.FeatureCollection:
+    """Get the features of some areas from the GAUL asset of their level.
+
+    The areas are filtered by the codes of the parents they fully cover (see :py:func:`_groups`) and by their own codes for the others, so that the size of the request does not grow with the number of areas of a whole country or continent.
+    """
+    filters = [ee.Filter.inList(f"gaul{lvl}_code", c) for lvl, c in _groups(level, codes).items()]
+    condition = filters[0] if len(filters) == 1 else ee.Filter.Or(*filters)
+
+    return ee.FeatureCollection(__gaul_asset__.format(level)).filter(condition)
+
+
+@versionadded(version="0.5.0", reason="Add an async API to request the boundaries")
+async def aitems(
+    name: Union[str, List[str]] = "",
+    admin: Union[str, List[str]] = "",
+    content_level: int = -1,
+    executor: Optional[Executor] = None,
+) -> dict:
+    """Request administrative boundaries without blocking the event loop.
+
+    The areas are resolved locally (see :py:class:`Items`) and the Earth Engine call is awaited with :py:meth:`Items.fetch_async` so that many requests can be in flight simultaneously.
+
+    Args:
+        name: The name of an administrative area. Cannot be set along with :code:`admin`. it can be a list or a single name.
+        admin: The id of an administrative area in the FAO GAUL nomenclature. Cannot be set along with :code:`name`. It can be a list or a single admin code.
+        content_level: The level to use in the final dataset. Default to -1 (use level from the area).
+        executor: The executor running the call. Default to the executor of the event loop.
+
+    Returns:
+        The boundaries as a GeoJSON FeatureCollection dictionary.
+    """
+    return await Items(name, admin, content_level).fetch_async(executor)
+
+
+@deprecated(version="0.3.1", reason="Use the Items class instead")
+class AdmItems(Items):
+    pass
+
+
+@deprecated(version="0.3.0", reason="Use the Items class instead")
+def get_items(
+    name: Union[str, List[str]] = "",
+    admin: Union[str, List[str]] = "",
+    content_level: int = -1,
+) -> ee.FeatureCollection:
+    """Return the requested administrative boundaries using the name or the administrative code."""
+    return Items(name, admin, content_level)
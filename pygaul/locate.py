@@ -0,0 +1,139 @@
+"""Reverse geocoding of points with the administrative boundaries.
+
+The boundaries are downloaded once from Earth Engine (and kept in the geometry cache) or read from a user file, then indexed in a shapely :code:`STRtree` to find the area of millions of points locally.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+from deprecated.sphinx import versionadded  # type: ignore [import-untyped]
+
+from .names import _tree
+from .tracing import span
+
+if TYPE_CHECKING:
+    import geopandas as gpd
+
+
+@versionadded(version="0.5.0", reason="Add a local reverse geocoding engine")
+class Locator:
+    def __init__(
+        self,
+        level: int = 0,
+        geometries: Union[str, Path, "gpd.GeoDataFrame", None] = None,
+        name: Union[str, List[str]] = "",
+        admin: Union[str, List[str]] = "",
+    ):
+        """Spatial index of the administrative boundaries of a level to locate points.
+
+        The boundaries are read from :code:`geometries` if set, otherwise the areas of the requested :code:`name` or :code:`admin` (default to the whole world) are downloaded with :py:meth:`Items.to_geodataframe` using the geometry cache, so they are only requested once to Earth Engine. This class requires :code:`geopandas`.
+
+        Args:
+            level: The level of the areas used to locate the points. Default to 0 (countries).
+            geometries: A GeoDataFrame or a file readable by geopandas (GeoParquet, GeoPackage, Shapefile...) with the boundaries and their :code:`gaul{level}_code` column.
+            name: The name(s) of the administrative areas to download. Cannot be set along with :code:`admin`.
+            admin: The code(s) of the administrative areas to download. Cannot be set along with :code:`name`.
+        """
+        import geopandas as gpd
+        import shapely
+
+        self.level = level
+
+        gdf: gpd.GeoDataFrame
+        if geometries is None:
+            from .items import Items
+            from .names import Names
+
+            admin = admin if name or admin else Names().gaul0_code.to_list()
+            gdf = Items(name, admin, content_level=level).to_geodataframe(cache=True)
+        elif isinstance(geometries, gpd.GeoDataFrame):
+            gdf = geometries
+        else:
+            file = Path(geometries)
+            read = gpd.read_parquet if file.suffix == ".parquet" else gpd.read_file
+            gdf = read(file)
+
+        with span("pygaul.index.locator", level=level, areas=len(gdf)):
+            gdf = gdf.to_crs(4326) if gdf.crs else gdf
+            self.codes = gdf[f"gaul{level}_code"].to_numpy(dtype=np.int64)
+            self.tree = shapely.STRtree(gdf.geometry.to_numpy())
+
+    def locate(self, lons: np.ndarray, lats: np.ndarray, chunk_size: int = 100000) -> pd.DataFrame:
+        """Find the administrative areas including some points.
+
+        The points are tested against the candidate boundaries of the spatial index by chunks to keep the memory bounded. A point on the border of several areas is given to the first one of the boundaries.
+
+        Args:
+            lons: The longitudes of the points in EPSG:4326.
+            lats: The latitudes of the points in EPSG:4326.
+            chunk_size: The number of points tested at once. Default to 100000.
+
+        Returns:
+            One line per point with the GAUL codes of its area and of the parents of this area (:code:`gaul0_code` to :code:`gaul{level}_code`), -1 if the point is outside of all the areas.
+        """
+        import shapely
+
+        lons, lats = np.asarray(lons, dtype=float), np.asarray(lats, dtype=float)
+        codes = np.full(len(lons), -1, dtype=np.int64)
+
+        with span("pygaul.locate", level=self.level, points=len(lons)):
+            for start in range(0, len(lons), chunk_size):
+                points = shapely.points(
+                    lons[start : start + chunk_size], lats[start : start + chunk_size]
+                )
+                point_index, area_index = self.tree.query(points, predicate="intersects")
+
+                # only the first area of each point is kept
+                order = np.lexsort((area_index, point_index))
+                point_index, area_index = point_index[order], area_index[order]
+                point_index, first = np.unique(point_index, return_index=True)
+                codes[start + point_index] = self.codes[area_index[first]]
+
+        # the parents are mapped once per unique code
+        result = {f"gaul{self.level}_code": codes}
+        parents = _tree()[2]
+        for level in range(self.level - 1, -1, -1):
+            unique, inverse = np.unique(result[f"gaul{level + 1}_code"], return_inverse=True)
+            mapped = np.array([parents.get(c, -1) for c in unique.tolist()], dtype=np.int64)
+            result[f"gaul{level}_code"] = mapped[inverse]
+
+        return pd.DataFrame(
+            {f"gaul{i}_code": result[f"gaul{i}_code"] for i in range(self.level + 1)}
+        )
+
+
+@lru_cache(maxsize=4)
+def _locator(level: int, geometries: Optional[str]) -> Locator:
+    """Get the locator of the world areas or of a file, built on first use."""
+    return Locator(level, geometries)
+
+
+@versionadded(version="0.5.0", reason="Add a local reverse geocoding engine")
+def locate(
+    lons: np.ndarray,
+    lats: np.ndarray,
+    level: int = 0,
+    geometries: Union[str, Path, "gpd.GeoDataFrame", None] = None,
+) -> pd.DataFrame:
+    """Find the administrative areas including some points.
+
+    The spatial index of the world areas or of a file is built on first use and kept in memory for the next calls (see :py:class:`Locator` to index only some areas). This function requires :code:`geopandas`.
+
+    Args:
+        lons: The longitudes of the points in EPSG:4326.
+        lats: The latitudes of the points in EPSG:4326.
+        level: The level of the areas used to locate the points. Default to 0 (countries).
+        geometries: A GeoDataFrame or a file with the boundaries and their :code:`gaul{level}_code` column. Default to the world areas downloaded from Earth Engine.
+
+    Returns:
+        One line per point with the GAUL codes of its area and of the parents of this area, -1 if the point is outside of all the areas.
+    """
+    if geometries is not None and not isinstance(geometries, (str, Path)):
+        locator = Locator(level, geometries)
+    else:
+        locator = _locator(level, None if geometries is None else str(geometries))
+
+    return locator.locate(lons, lats)
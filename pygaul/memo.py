@@ -0,0 +1,124 @@
+"""Memoization of the requests of the lib.
+
+Services using the lib tend to request the same areas again and again. The results of :py:class:`Names` and :py:class:`Items` are thus kept in bounded caches keyed on their normalized arguments so that a repeated request only costs a lookup and a copy of the cached result.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, NamedTuple
+
+from deprecated.sphinx import versionadded  # type: ignore [import-untyped]
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a memo cache, as the ones of :py:func:`functools.lru_cache`."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class Memo:
+    def __init__(self, maxsize: int = 128):
+        """Bounded and thread-safe cache of the results of a function.
+
+        The least recently used results are removed when the cache is full. The values are computed outside of the lock so that a slow request never blocks the other threads; two threads missing the same key at the same time will both compute it.
+
+        Args:
+            maxsize: The maximal number of results kept in the cache. Set to 0 to disable the cache.
+        """
+        self.maxsize = maxsize
+        self.hits = self.misses = 0
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Get the result of a key, compute and store it if it is not cached.
+
+        Args:
+            key: The normalized arguments of the request.
+            compute: The function computing the result of the request. The errors it raises are not cached.
+
+        Returns:
+            The cached result.
+        """
+        with self._lock:
+            if key in self._data:
+                self.hits += 1
+                self._data.move_to_end(key)
+                return self._data[key]
+            self.misses += 1
+
+        value = compute()
+
+        with self._lock:
+            self._data[key] = value
+            self._evict()
+
+        return value
+
+    def _evict(self):
+        """Remove the least recently used results until the cache fits in its maximal size."""
+        while len(self._data) > max(self.maxsize, 0):
+            self._data.popitem(last=False)
+
+    def resize(self, maxsize: int):
+        """Change the maximal size of the cache, removing the least recently used results if needed."""
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def info(self) -> CacheInfo:
+        """Get the statistics of the cache."""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def clear(self):
+        """Remove all the results and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+
+def _normalize(value: Any) -> str:
+    """Normalize a name or a code the way the lib compares them."""
+    return str(value).strip().lower()
+
+
+_MEMOS = {
+    "names": Memo(int(os.environ.get("PYGAUL_MEMO_SIZE", 128))),
+    "items": Memo(int(os.environ.get("PYGAUL_MEMO_SIZE", 128))),
+}
+"The memo caches of the :py:class:`Names` and :py:class:`Items` requests."
+
+
+@versionadded(version="0.5.0", reason="Add a memoization of the Names and Items requests")
+def cache_info() -> Dict[str, CacheInfo]:
+    """Get the statistics of the memo caches of the lib.
+
+    Returns:
+        The hits, misses, maximal size and current size of the :code:`"names"` and :code:`"items"` caches.
+    """
+    return {kind: memo.info() for kind, memo in _MEMOS.items()}
+
+
+@versionadded(version="0.5.0", reason="Add a memoization of the Names and Items requests")
+def cache_clear():
+    """Empty the memo caches of the lib and reset their statistics."""
+    for memo in _MEMOS.values():
+        memo.clear()
+
+
+@versionadded(version="0.5.0", reason="Add a memoization of the Names and Items requests")
+def set_cache_size(maxsize: int):
+    """Set the maximal number of requests kept in each memo cache of the lib.
+
+    The default size is 128, it can also be set with the :code:`PYGAUL_MEMO_SIZE` environment variable.
+
+    Args:
+        maxsize: The maximal number of results kept in each cache. Set to 0 to disable the memoization.
+    """
+    for memo in _MEMOS.values():
+        memo.resize(maxsize)
@@ -0,0 +1,816 @@
+"""Names of the administrative areas of the FAO GAUL database.
+
+All the requests are resolved locally using the parquet database shipped with the lib and a set of indexes built from it on first use.
+"""
+
+import hashlib
+import heapq
+import operator
+import os
+import re
+import unicodedata
+import warnings
+from difflib import SequenceMatcher
+from functools import reduce
+from pathlib import Path
+from typing import Dict, Hashable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from deprecated.sphinx import deprecated, versionadded  # type: ignore [import-untyped]
+
+from . import __gaul_data__, __version__, _cache_dir
+from .extents import _spatial_filter
+from .memo import _MEMOS, _normalize
+from .store import _state, pinned, stored
+from .tracing import traced
+
+
+@stored
+@traced("pygaul.load")
+def _df() -> pd.DataFrame:
+    """Get the parquet database of the store in use.
+
+    The names are stored as categories and the codes as nullable integers to keep the table small in memory. Missing levels are set to :code:`pd.NA` (they are empty strings in the parquet file).
+
+    If the store is configured with :code:`mmap=True` (default to the :code:`PYGAUL_MMAP` environment variable set to :code:`1`), the table is read from a memory-mapped Arrow IPC copy of the database (see :py:func:`_arrow_file`). Its columns are Arrow backed (:py:class:`pandas.ArrowDtype`) and wrap the buffers of the mapped file without copying them: the processes using the lib share the pages of this file instead of holding their own copy of the table.
+    """
+    mmap = _state().mmap
+    if mmap is None:
+        mmap = os.environ.get("PYGAUL_MMAP", "0").lower() in ["1", "true"]
+    if mmap is True:
+        source = pa.memory_map(str(_arrow_file()))
+        return pa.ipc.open_file(source).read_all().to_pandas(types_mapper=pd.ArrowDtype)
+
+    return _read_parquet()
+
+
+def _read_parquet() -> pd.DataFrame:
+    """Read the parquet database with the compact types of the lib."""
+    return _query()
+
+
+def _filter(
+    level: int = -1, continent: Sequence[str] = (), country: Sequence[Union[str, int]] = ()
+) -> Optional[pc.Expression]:
+    """Build the parquet filter of the lines of some areas.
+
+    Args:
+        level: Keep only the lines including an area of this level. Default to -1 (all the lines).
+        continent: The continents of the lines. Default to all the continents.
+        country: The GAUL codes of the countries of the lines. Default to all the countries.
+
+    Returns:
+        The filter expression or None if no filter is set.
+    """
+    # the missing levels are empty strings in the parquet file
+    filters = [] if level == -1 else [pc.field(f"gaul{level}_code") != ""]
+    if len(continent) > 0:
+        filters.append(pc.field("continent").isin([_normalize(c) for c in continent]))
+    if len(country) > 0:
+        filters.append(pc.field("gaul0_code").isin([str(c).strip() for c in country]))
+
+    return reduce(operator.and_, filters) if filters else None
+
+
+def _query(
+    columns: Optional[List[str]] = None,
+    level: int = -1,
+    continent: Sequence[str] = (),
+    country: Sequence[Union[str, int]] = (),
+    compact: bool = True,
+) -> pd.DataFrame:
+    """Read some lines and columns of the parquet database.
+
+    The file is sorted by continent and country and split in small row groups: only the requested columns are read and the row groups that cannot match the filters (see :py:func:`_filter`) are skipped using their statistics.
+
+    Args:
+        columns: The columns to read. Default to all the columns.
+        level: Keep only the lines including an area of this level. Default to -1 (all the lines).
+        continent: The continents of the lines. Default to all the continents.
+        country: The GAUL codes of the countries of the lines. Default to all the countries.
+        compact: If False, the columns are returned as strings with empty strings for the missing levels instead of the compact types of the lib. Default to True.
+
+    Returns:
+        The lines in the order of the database, indexed by their position in it.
+    """
+    filters = _filter(level, continent, country)
+    table = pq.read_table(_state().path, columns=columns, filters=filters, use_pandas_metadata=True)
+    # the rewritten database keeps the position of the lines in the original table, other files
+    # are read in their own order
+    if "__index_level_0__" in table.column_names:
+        table = table.sort_by("__index_level_0__")
+    df = table.to_pandas()
+    if compact is False:
+        return df
+
+    df = df.replace("", None)
+    codes = [f"gaul{i}_code" for i in range(3)]
+    for column in df.columns:
+        df[column] = df[column].astype("Int32" if column in codes else "category")
+
+    return df
+
+
+def _arrow_file() -> Path:
+    """Get the Arrow IPC copy of the database, generate it on first use.
+
+    The file is written in the cache directory of the lib (set with the :code:`PYGAUL_CACHE_DIR` environment variable) and named after the lib version so that a new release regenerates it. The copies of a database loaded from another path are also named after the path, size and modification time of the file. It is first written under a temporary name and then moved so that concurrent processes never read a partial file.
+
+    Returns:
+        The path to the Arrow IPC file.
+    """
+    path, name = _state().path, f"gaul_database-{__version__}"
+    if path != __gaul_data__:
+        stat = path.stat()
+        source = f"{path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+        name += "-" + hashlib.sha1(source.encode()).hexdigest()[:12]
+
+    file = _cache_dir() / f"{name}.arrow"
+    if not file.exists():
+        file.parent.mkdir(parents=True, exist_ok=True)
+        # plain string columns, the dictionary ones cannot be wrapped by pandas without a copy
+        table = pa.Table.from_pandas(_read_parquet(), preserve_index=False)
+        fields = [
+            pa.field(f.name, pa.string()) if pa.types.is_dictionary(f.type) else f
+            for f in table.schema
+        ]
+        table = table.cast(pa.schema(fields))
+        tmp = file.with_suffix(f".{os.getpid()}.tmp")
+        with pa.OSFile(str(tmp), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        os.replace(tmp, file)
+
+    return file
+
+
+def _str(column: pd.Series) -> pd.Series:
+    """Get a column of the database as strings, missing values being empty strings."""
+    return column.astype(str).where(column.notna(), "")
+
+
+_NOT_ALNUM = re.compile(r"[^0-9a-z]")
+"The characters of a lowercased ASCII name replaced by spaces when it is folded."
+
+
+def _fold(value: str) -> str:
+    """Get the folded form of a name: without case, accents, punctuation and repeated spaces.
+
+    The value is decomposed (Unicode NFKD) and its combining marks are dropped, so that :code:`"Côte d'Ivoire"` and :code:`"COTE D IVOIRE"` are both folded to :code:`"cote d ivoire"`.
+    """
+    if value.isascii():
+        return " ".join(_NOT_ALNUM.sub(" ", value.lower()).split())
+
+    chars = unicodedata.normalize("NFKD", value.casefold())
+    chars = "".join(
+        " " if unicodedata.category(c)[0] in "PSZ" else c
+        for c in chars
+        if not unicodedata.combining(c)
+    )
+    return " ".join(chars.split())
+
+
+def _lookup_keys(column: pd.Series, folded: bool = False) -> pd.Series:
+    """Get the lookup keys of a column: its lowercased values or their folded form (see :py:func:`_fold`)."""
+    keys = _str(column).str.lower()
+    if folded is True:
+        keys = keys.map({k: _fold(k) for k in keys.unique()})
+
+    return keys
+
+
+@stored
+@traced("pygaul.index.index")
+def _index(column: str, folded: bool = False) -> Dict[str, Dict[int, np.ndarray]]:
+    """Get the lookup index of the names or the codes of the parquet database.
+
+    The index is built once and maps every lowercased value of the columns to the row positions where it appears, grouped by administrative level.
+
+    Args:
+        column: The column template to index, either :code:`"gaul{}_name"` or :code:`"gaul{}_code"`.
+        folded: If True, the values are indexed by their folded form (see :py:func:`_fold`) instead of their lowercased form. Default to False.
+
+    Returns:
+        The lowercased values associated to their row positions in each level.
+    """
+    df = _df()
+    index: Dict[str, Dict[int, np.ndarray]] = {}
+    for level in range(3):
+        keys = _lookup_keys(df[column.format(level)], folded)
+        for key, positions in keys.groupby(keys, sort=False).indices.items():
+            if key != "":
+                index.setdefault(key, {})[level] = positions
+
+    return index
+
+
+@stored
+@traced("pygaul.index.keys")
+def _keys(column: str, folded: bool = False) -> pd.DataFrame:
+    """Get the lookup table of the names or the codes of the parquet database.
+
+    It is the tabular counterpart of :py:func:`_index` used to resolve many values with a single join. Each lowercased value is associated to its level, the position of its first line and the number of distinct areas using it.
+
+    Args:
+        column: The column template to index, either :code:`"gaul{}_name"` or :code:`"gaul{}_code"`.
+        folded: If True, the values are indexed by their folded form (see :py:func:`_fold`) instead of their lowercased form. Default to False.
+
+    Returns:
+        The lookup table indexed by the lowercased values.
+    """
+    df, tables = _df(), []
+    for level in range(3):
+        table = pd.DataFrame(
+            {
+                "key": _lookup_keys(df[column.format(level)], folded),
+                "level": level,
+                "row": np.arange(len(df)),
+                "code": df[f"gaul{level}_code"],
+            }
+        )
+        table = table[table.code.notna()].groupby("key", sort=False)
+        tables.append(
+            table.agg(level=("level", "first"), row=("row", "first"), count=("code", "nunique"))
+        )
+
+    # same rule as in Names: keep the level of the first matching line, the smallest one if
+    # the value is used in several levels of this line
+    keys = pd.concat(tables).reset_index().sort_values(["row", "level"], kind="stable")
+
+    return keys.drop_duplicates("key").set_index("key")
+
+
+@stored
+@traced("pygaul.index.letters")
+def _letters(column: str) -> Tuple[np.ndarray, np.ndarray, Dict[str, int], np.ndarray]:
+    """Get the letter index of the names or the codes of the parquet database.
+
+    Each lowercased value is described by the number of occurrences of each letter. It gives, for any request, an upper bound of the similarity ratio computed by :py:class:`difflib.SequenceMatcher` (the one of :py:meth:`difflib.SequenceMatcher.quick_ratio`) for the whole vocabulary at once.
+
+    Args:
+        column: The column template to index, either :code:`"gaul{}_name"` or :code:`"gaul{}_code"`.
+
+    Returns:
+        The vocabulary of lowercased values, their lengths, the position of each letter in the index and the letter counts of each value.
+    """
+    vocabulary = np.array(list(_index(column)))
+    lengths = np.char.str_len(vocabulary)
+
+    # read the fixed width unicode array as a matrix of code points (0 is the padding)
+    points = vocabulary.view(np.uint32).reshape(len(vocabulary), -1)
+    lut = np.zeros(points.max() + 1, dtype=np.int64)
+    lut[points.ravel()] = 1
+    unique = np.flatnonzero(lut)
+    lut[unique] = np.arange(len(unique))
+
+    # count the letters of each value in a single pass over the flattened matrix
+    flat = np.arange(len(vocabulary))[:, None] * len(unique) + lut[points]
+    counts = np.bincount(flat.ravel(), minlength=len(vocabulary) * len(unique))
+    counts = counts.reshape(len(vocabulary), len(unique)).astype(np.uint8)
+    letters = {chr(p): i for i, p in enumerate(unique) if p != 0}
+
+    return vocabulary, lengths, letters, counts
+
+
+@stored
+@traced("pygaul.index.continents")
+def _continents() -> Dict[str, np.ndarray]:
+    """Get the codes of the countries of each continent.
+
+    The continents are the ones set by FAO in the database, lowercased. The countries are sorted by their first line in the database. The lines without continent (:code:`"--"`) are ignored.
+    """
+    df = _df().drop_duplicates(subset="gaul0_code")
+    df = df[df.gaul0_code.notna()]
+    groups = df.groupby("continent", observed=True, sort=False).gaul0_code
+
+    return {
+        _normalize(c): codes.to_numpy(dtype=np.int64)
+        for c, codes in groups
+        if _normalize(c).isalpha()
+    }
+
+
+@stored
+@traced("pygaul.index.tree")
+def _tree() -> Tuple[Dict[int, int], Dict[int, int], Dict[int, int], Dict[int, np.ndarray]]:
+    """Get the hierarchy of the administrative areas of the parquet database.
+
+    Every code is unique across levels so the hierarchy is stored in flat mappings. The children of an area are sorted by their first line in the database.
+
+    Returns:
+        The level of each code, the position of its first line, the code of its parent and the codes of its children.
+    """
+    df = _df()
+    levels: Dict[int, int] = {}
+    rows: Dict[int, int] = {}
+    parents: Dict[int, int] = {}
+    children: Dict[int, np.ndarray] = {}
+    for level in range(3):
+        column = df[f"gaul{level}_code"]
+        positions = np.flatnonzero(column.notna() & ~column.duplicated())
+        codes = column.to_numpy(dtype=np.int64, na_value=-1)[positions]
+        levels.update(dict.fromkeys(codes.tolist(), level))
+        rows.update(zip(codes.tolist(), positions.tolist()))
+        if level > 0:
+            parent_codes = df[f"gaul{level - 1}_code"].to_numpy(dtype=np.int64, na_value=-1)[
+                positions
+            ]
+            parents.update(zip(codes.tolist(), parent_codes.tolist()))
+            groups = pd.Series(codes).groupby(parent_codes, sort=False)
+            children.update({p: c.to_numpy() for p, c in groups})
+
+    return levels, rows, parents, children
+
+
+def _code(admin: Union[str, int]) -> int:
+    """Get the code of an administrative area as an integer, raise an error if it does not exist."""
+    admin = str(admin).strip()
+    code = int(admin) if admin.isdigit() else -1
+    if code not in _tree()[0]:
+        close_ids = suggest(admin=str(admin), n=5)
+        raise ValueError(
+            f'The requested "{admin}" is not part of FAO GAUL 2024. The closest '
+            f"matches are: {', '.join(close_ids)}."
+        )
+
+    return code
+
+
+def _descend(codes: np.ndarray) -> np.ndarray:
+    """Get the codes of all the children of a set of areas from the same level, sorted by their first line in the database."""
+    _, rows, _, children = _tree()
+    codes = np.concatenate([children.get(c, np.array([], dtype=np.int64)) for c in codes.tolist()])
+    return codes[np.argsort([rows[c] for c in codes.tolist()])]
+
+
+@versionadded(version="0.5.0", reason="Add hierarchy functions to navigate the areas")
+@pinned
+def children(admin: Union[str, int], level: int = -1) -> List[str]:
+    """Get the administrative codes of the areas included in an administrative area.
+
+    Args:
+        admin: The id of an administrative area in the FAO GAUL nomenclature.
+        level: The level of the returned areas. Default to -1 (the level right below the area).
+
+    Returns:
+        The codes of the areas of the requested level included in the area sorted as they appear in the database, empty if there is none.
+    """
+    if int(level) > 2:
+        raise ValueError(f"The requested level ({level}) does not exist, the last one is 2.")
+
+    code = _code(admin)
+    area_level = _tree()[0][code]
+    level = area_level + 1 if level == -1 else int(level)
+    if level <= area_level:
+        raise ValueError(f"The requested level ({level}) is not below the area ({area_level}).")
+
+    codes = np.array([code])
+    for _ in range(level - area_level):
+        codes = _descend(codes)
+
+    return [str(c) for c in codes]
+
+
+@versionadded(version="0.5.0", reason="Add hierarchy functions to navigate the areas")
+@pinned
+def descendants(admin: Union[str, int]) -> List[str]:
+    """Get the administrative codes of all the areas included in an administrative area.
+
+    Args:
+        admin: The id of an administrative area in the FAO GAUL nomenclature.
+
+    Returns:
+        The codes of the included areas, level by level.
+    """
+    codes, result = np.array([_code(admin)]), []
+    while len(codes := _descend(codes)):
+        result += [str(c) for c in codes]
+
+    return result
+
+
+@versionadded(version="0.5.0", reason="Add hierarchy functions to navigate the areas")
+@pinned
+def parents(admin: Union[str, int]) -> List[str]:
+    """Get the administrative codes of the areas including an administrative area.
+
+    Args:
+        admin: The id of an administrative area in the FAO GAUL nomenclature.
+
+    Returns:
+        The codes of the including areas from the country to the direct parent, empty for a country.
+    """
+    code, parent_codes = _code(admin), _tree()[2]
+    result: List[str] = []
+    while (code := parent_codes.get(code, -1)) != -1:
+        result.insert(0, str(code))
+
+    return result
+
+
+@versionadded(version="0.5.0", reason="Add a suggest function to find close names or codes")
+@pinned
+@traced("pygaul.suggest")
+def suggest(name: str = "", admin: str = "", n: int = 5, cutoff: float = 0.6) -> List[str]:
+    """Find the names or administrative codes closest to a requested one.
+
+    The result is the same as :py:func:`difflib.get_close_matches` over all the names (or codes) of the database but a cached letter index is used to compute an upper bound of the similarity of every candidate at once. Candidates are then scored from the most promising one and the search stops as soon as no remaining candidate can enter the results. Names are returned capitalized and codes uppercased.
+
+    Args:
+        name: The name of an administrative area. Cannot be set along with :code:`admin`.
+        admin: The id of an administrative area in the FAO GAUL nomenclature. Cannot be set along with :code:`name`.
+        n: The maximum number of suggestions, it must be positive. Default to 5.
+        cutoff: The minimal similarity ratio of the suggestions, between 0 and 1. Default to 0.6.
+
+    Returns:
+        The closest names or codes, best match first.
+    """
+    # sanitary check on parameters
+    if name and admin:
+        raise ValueError('"name" and "id" cannot be set at the same time.')
+    if not n > 0:
+        raise ValueError(f"n must be > 0: {n!r}")
+
+    is_name = True if name else False
+    id = (name if is_name else admin).lower()
+    vocabulary, lengths, letters, counts = _letters("gaul{}_name" if is_name else "gaul{}_code")
+
+    # compute the upper bound of the ratio of every candidate from the letters they share
+    # with the request, letters unknown to the vocabulary cannot be matched
+    id_letters = {c: id.count(c) for c in set(id) if c in letters}
+    columns = [letters[c] for c in id_letters]
+    shared = np.minimum(counts[:, columns], list(id_letters.values())).sum(axis=1)
+    bounds = 2 * shared / (lengths + len(id))
+    candidates = np.flatnonzero(bounds >= cutoff)
+    candidates = candidates[np.argsort(-bounds[candidates], kind="stable")]
+
+    # score the candidates with the same rules as difflib.get_close_matches
+    # (same tie-breaking on the candidate value) until the bound is too low to compete
+    results: List[Tuple[float, str]] = []
+    matcher = SequenceMatcher()
+    matcher.set_seq2(id)
+    for i in candidates:
+        if len(results) == n and bounds[i] < results[0][0]:
+            break
+        matcher.set_seq1(vocabulary[i])
+        score = matcher.ratio()
+        if score >= cutoff:
+            heapq.heappush(results, (score, vocabulary[i]))
+            if len(results) > n:
+                heapq.heappop(results)
+
+    close_ids = [x for _, x in sorted(results, reverse=True)]
+    return [i.capitalize() for i in close_ids] if is_name else [i.upper() for i in close_ids]
+
+
+def _names(
+    name: str = "",
+    admin: str = "",
+    content_level: int = -1,
+    complete: bool = False,
+    bbox: Optional[Sequence[float]] = None,
+    around: Optional[Sequence[float]] = None,
+) -> Tuple[pd.DataFrame, List[str]]:
+    """Get the names of an area from the memo cache, compute them on first request.
+
+    The requests are keyed on their normalized arguments (names and codes are compared stripped and lowercased) and on the state of the store in use: the result is computed with the data of this state only.
+
+    Args:
+        name: The name of a administrative area. Cannot be set along with :code:`admin`.
+        admin: The id of an administrative area in the FAO GAUL nomenclature. Cannot be set along with :code:`name`.
+        content_level: The level to use in the final dataset. Default to -1 (use level of the selected area).
+        complete: If True, the method will return all the names of the higher administrative areas. Default to False.
+        bbox: Keep only the areas overlapping this bounding box (minx, miny, maxx, maxy) in EPSG:4326.
+        around: Keep only the areas closer than a radius to a point, given as (lon, lat, km).
+
+    Returns:
+        The cached names (they should not be modified) and the warnings raised by the request.
+    """
+    # sanitary check on parameters
+    if name and admin:
+        raise ValueError('"name" and "id" cannot be set at the same time.')
+
+    # the spatial filters are part of the key as tuples of floats
+    filters = tuple(None if f is None else tuple(map(float, f)) for f in [bbox, around])
+    key: Tuple[Hashable, ...] = (
+        "name" if name else "admin",
+        _normalize(name or admin),
+        int(content_level),
+        complete,
+    )
+    state = _state()
+    key += (*filters, state.token)
+
+    return _MEMOS["names"].get(
+        key, lambda: state.call(_compute_names, name, admin, content_level, complete, *filters)
+    )
+
+
+class _Area(NamedTuple):
+    """Resolution of a name or a code: the areas it designates and all their sub-areas.
+
+    It is computed once per request and gives both the uniqueness of the requested area and the codes of any content level.
+    """
+
+    level: int
+    "The level of the requested area(s)."
+
+    layers: List[np.ndarray]
+    "The codes of the requested areas and of their sub-areas, one array per level from :code:`level` to :code:`max_level`."
+
+    @property
+    def max_level(self) -> int:
+        """The smallest level available in the requested areas."""
+        return self.level + len(self.layers) - 1
+
+    def content_level(self, content_level: int = -1) -> Tuple[int, List[str]]:
+        """Get the level to use in the final dataset.
+
+        Args:
+            content_level: The requested level. Default to -1 (use level of the requested area).
+
+        Returns:
+            The level clipped to the levels available in the area and the warnings explaining the fallback.
+        """
+        messages: List[str] = []
+        content_level = int(content_level)
+        if content_level == -1:
+            content_level = self.level
+        elif content_level < self.level:
+            messages.append(
+                f"The requested level ({content_level}) is higher than the area ({self.level}). "
+                f"Fallback to {self.level}."
+            )
+            content_level = self.level
+
+        if content_level > self.max_level:
+            messages.append(
+                f"The requested level ({content_level}) is higher than the max level "
+                f"in this country ({self.max_level}). Fallback to {self.max_level}."
+            )
+            content_level = self.max_level
+
+        return content_level, messages
+
+    def codes(self, content_level: int) -> np.ndarray:
+        """Get the codes of the areas of an available level, sorted by their first line in the database."""
+        return self.layers[content_level - self.level]
+
+
+def _area(name: str = "", admin: str = "") -> _Area:
+    """Find the area(s) designated by a name or a code.
+
+    Args:
+        name: The name of a administrative area. Cannot be set along with :code:`admin`.
+        admin: The id of an administrative area in the FAO GAUL nomenclature. Cannot be set along with :code:`name`.
+
+    Returns:
+        The level of the area(s) and the codes of all their sub-areas.
+    """
+    # sanitary check on parameters
+    if name and admin:
+        raise ValueError('"name" and "id" cannot be set at the same time.')
+
+    # set the id we look for and tell the function if its a name or an admin
+    is_name = True if name else False
+    id = (name if name else admin).strip()
+
+    # read the data and find if the element exist
+    column = "gaul{}_name" if is_name else "gaul{}_code"
+    match = _index(column).get(id.lower())
+
+    # a name written with other accents, punctuation or spaces is matched on its folded form
+    if is_name and match is None:
+        match = _index(column, True).get(_fold(id))
+
+    # a continent designates all its countries
+    if is_name and match is None and id.lower() in _continents():
+        level, codes = 0, _continents()[id.lower()]
+
+    elif match is None:
+        # find the 5 closest names/id
+        close_ids = suggest(name, admin, n=5)
+        raise ValueError(
+            f'The requested "{id}" is not part of FAO GAUL 2024. The closest '
+            f"matches are: {', '.join(close_ids)}."
+        )
+
+    else:
+        # Get the level of the identified area: the one of the first matching line
+        # and the smallest one if the id is used in several levels of this line
+        level = min(match, key=lambda i: (match[i][0], i))
+        codes = _df()[f"gaul{level}_code"].iloc[match[level]].unique().to_numpy(dtype=np.int64)
+
+    # load the areas of each level included in the requested area(s)
+    layers = [codes]
+    while level + len(layers) < 3 and len(sub_codes := _descend(layers[-1])):
+        layers.append(sub_codes)
+
+    return _Area(level, layers)
+
+
+@traced("pygaul.names")
+def _compute_names(
+    name: str = "",
+    admin: str = "",
+    content_level: int = -1,
+    complete: bool = False,
+    bbox: Optional[Sequence[float]] = None,
+    around: Optional[Sequence[float]] = None,
+) -> Tuple[pd.DataFrame, List[str]]:
+    """Compute the names of an area, see :py:class:`Names` for the parameters."""
+    # if a name or admin number is set, we need to filter the dataset accordingly
+    # if not we will simply consider the world dataset
+    if name or admin:
+        # the warnings are returned to be raised again each time the result is read from the memo
+        area = _area(name, admin)
+        content_level, messages = area.content_level(content_level)
+
+        # the first line of each area gives its names
+        rows = _tree()[1]
+        positions = [rows[c] for c in area.codes(content_level).tolist()]
+        sub_df = _df().take(positions).reset_index(drop=True)
+
+    else:  # no admin and no name
+        content_level, messages = 0 if content_level == -1 else content_level, []
+
+        # if the table is not loaded yet, only the lines and columns of the level are read
+        # the list will contain duplicate as all the smaller admin level will be included
+        if complete is not True and not _df.loaded():
+            level_columns = [f"gaul{content_level}_name", f"gaul{content_level}_code"]
+            df = _query(level_columns, level=content_level, compact=False)
+        else:
+            df = _df()
+            df = df[df[f"gaul{content_level}_code"].notna()]
+        sub_df = df.drop_duplicates(subset=f"gaul{content_level}_code", ignore_index=True)
+
+    # keep only the areas matching the spatial filters using their extents
+    if bbox is not None or around is not None:
+        codes = _spatial_filter(content_level, bbox, around).astype(str)
+        sub_df = sub_df[_str(sub_df[f"gaul{content_level}_code"]).isin(codes).to_numpy()]
+
+    # get the columns name corresponding to the requested level
+    columns = [f"gaul{content_level}_name", f"gaul{content_level}_code"]
+
+    # filter the df if complete is set to False, the only displayed columns will be the one requested
+    # the compact types of the database are converted back to strings
+    final_df = sub_df if complete is True else sub_df[columns]
+
+    names = pd.DataFrame({column: _str(final_df[column]) for column in final_df.columns})
+
+    return names, messages
+
+
+def _copy(df: pd.DataFrame) -> pd.DataFrame:
+    """Copy a cached frame, the data is only shared when pandas copy-on-write protects it."""
+    copy_on_write = int(pd.__version__.split(".")[0]) >= 3 or pd.options.mode.copy_on_write is True
+    return df.copy(deep=not copy_on_write)
+
+
+@versionadded(version="0.3.1", reason="Add a Names object to handle names")
+class Names(pd.DataFrame):
+    def __init__(
+        self,
+        name: str = "",
+        admin: str = "",
+        content_level: int = -1,
+        complete: bool = False,
+        bbox: Optional[Sequence[float]] = None,
+        around: Optional[Sequence[float]] = None,
+    ):
+        """Object to handle names of administrative layer using the name or the administrative code.
+
+        Compute a pandas DataFrame of the names as FAO GAUL codes of and administrative region. The region can be requested either by its "name" or its "admin", the lib will identify the corresponding level on the fly. The user can also request for a specific level for its content e.g. get all admin level 1 of a country. If nothing is set we will infer the level of the item and if the level is higher than the found item, it will be ignored. If Nothing is found the method will raise an error.
+
+        Args:
+            name: The name of a administrative area. Cannot be set along with :code:`admin`.
+            admin: The id of an administrative area in the FAO GAUL nomenclature. Cannot be set along with :code:`name`.
+            content_level: The level to use in the final dataset. Default to -1 (use level of the selected area).
+            complete: If True, the method will return all the names of the higher administrative areas. Default to False.
+            bbox: Keep only the areas overlapping this bounding box, given as (minx, miny, maxx, maxy) in EPSG:4326. It requires the extents of the areas (see :py:func:`build_extents`).
+            around: Keep only the areas closer than a radius to a point, given as (lon, lat, km). The distance is measured to the bounding box of the areas. It requires the extents of the areas (see :py:func:`build_extents`).
+        """
+        df, messages = _names(name, admin, content_level, complete, bbox, around)
+        for message in messages:
+            warnings.warn(message)
+
+        super().__init__(_copy(df))
+
+
+@versionadded(version="0.5.0", reason="Add an iterator to stream the names of the database")
+def iter_names(
+    level: int = 0,
+    continent: Union[str, Sequence[str]] = "",
+    country: Union[str, int, Sequence[Union[str, int]]] = "",
+    batch_size: int = 10000,
+    complete: bool = False,
+) -> Iterator[pd.DataFrame]:
+    """Stream the names of all the areas of a level.
+
+    The parquet database is scanned by batches without loading the whole table: only the requested columns are read and the row groups that cannot match the :code:`continent` and :code:`country` filters are skipped. The areas are yielded in the order of the file (grouped by continent and country), concatenated the batches include the same lines as :code:`Names(content_level=level, complete=complete)` restricted to the requested countries.
+
+    Args:
+        level: The level of the areas. Default to 0 (countries).
+        continent: The name(s) of continents to filter the areas. Default to all the continents.
+        country: The GAUL code(s) of countries to filter the areas. Default to all the countries.
+        batch_size: The maximal number of rows read in a batch. Default to 10000.
+        complete: If True, the batches include the names and codes of all the levels. Default to False.
+
+    Yields:
+        The names and codes of the areas as small DataFrames (the empty batches are skipped).
+    """
+    import pyarrow.dataset as ds
+
+    dataset = ds.dataset(_state().path, format="parquet")
+    columns = [f"gaul{level}_name", f"gaul{level}_code"]
+    if complete is True:
+        columns = [c for c in dataset.schema.names if not c.startswith("__")]
+
+    continents = [continent] if isinstance(continent, str) else continent
+    countries = [country] if isinstance(country, (str, int)) else country
+    expression = _filter(level, [c for c in continents if c], [c for c in countries if c != ""])
+
+    # the areas spread over several lines are only yielded at their first line
+    seen: set = set()
+    for batch in dataset.to_batches(columns=columns, filter=expression, batch_size=batch_size):
+        first = []
+        for code in batch.column(f"gaul{level}_code").to_pylist():
+            first.append(code not in seen)
+            seen.add(code)
+        if any(first):
+            yield batch.filter(pa.array(first)).to_pandas()
+
+
+@versionadded(version="0.5.0", reason="Add a resolve function to identify areas in bulk")
+@pinned
+@traced("pygaul.resolve")
+def resolve(
+    name: Union[str, Sequence[str], pd.Series, np.ndarray] = "",
+    admin: Union[str, Sequence[str], pd.Series, np.ndarray] = "",
+) -> pd.DataFrame:
+    """Identify many administrative areas at once using their names or their administrative codes.
+
+    All the values are matched in a single join against the GAUL database instead of building one :py:class:`Names` per value. Each value is associated to the level of the identified area and to the names and codes of this area and its parents. The matching follows the same rules as :py:class:`Names` (case insensitive) and the status column tells if the value was :code:`"found"`, :code:`"not found"` or :code:`"not unique"` (the name is shared by several areas, use the :code:`admin` codes instead). Codes and names are left empty when the value cannot be identified.
+
+    Args:
+        name: The names of administrative areas. Cannot be set along with :code:`admin`. It can be a list, a pandas Series, a numpy array or a single name.
+        admin: The ids of administrative areas in the FAO GAUL nomenclature. Cannot be set along with :code:`name`. It can be a list, a pandas Series, a numpy array or a single admin code.
+
+    Returns:
+        One line per requested value (keeping the index of a Series) with the value, its level (-1 if not found), the names and codes of the area hierarchy and the status.
+    """
+    # sanitary check on parameters, an empty sequence of values is still set
+    name_set, admin_set = [not (isinstance(v, str) and v == "") for v in (name, admin)]
+    if name_set and admin_set:
+        raise ValueError('"name" and "id" cannot be set at the same time.')
+
+    # set the values we look for and tell the function if they are names or admins
+    is_name = name_set
+    values = name if is_name else admin
+    values = pd.Series([values] if isinstance(values, str) else values)
+    column = "gaul{}_name" if is_name else "gaul{}_code"
+
+    # join the values with the lookup table
+    # the values are normalized like the requests of Names (each distinct value once) and the
+    # missing ones are never found
+    codes, uniques = pd.factorize(values.astype(str).where(values.notna(), ""))
+    lowered = np.array([_normalize(u) for u in uniques], dtype=object)[codes]
+    matched = _keys(column).reindex(lowered).reset_index(drop=True)
+
+    # the names that are not found are matched again on their folded form
+    missing = matched.row.isna().to_numpy()
+    if is_name and missing.any():
+        codes, uniques = pd.factorize(lowered[missing])
+        folded = _keys(column, True).reindex([_fold(u) for u in uniques])
+        matched.loc[missing, :] = folded.to_numpy()[codes]
+    found = matched.row.notna().to_numpy()
+    unique = found & (matched["count"] == 1).to_numpy()
+    level = matched.level.fillna(-1).astype(int).to_numpy()
+
+    # read the area hierarchy from the first matching line of each value
+    df = _df()
+    rows = df.take(matched.row.fillna(0).astype(int).to_numpy()).reset_index(drop=True)
+    result = pd.DataFrame({"name" if is_name else "admin": values.to_numpy(), "level": level})
+    for i in range(3):
+        for col in [f"gaul{i}_name", f"gaul{i}_code"]:
+            result[col] = _str(rows[col]).where(unique & (level >= i), "")
+    result["status"] = np.select([unique, found], ["found", "not unique"], "not found")
+    result.index = values.index
+
+    return result
+
+
+@deprecated(version="0.3.1", reason="Use the Names object instead")
+class AdmNames(Names):
+    pass
+
+
+@deprecated(version="0.3.0", reason="Use the Names object instead")
+def get_names(
+    name: str = "", admin: str = "", content_level: int = -1, complete: bool = False
+) -> pd.DataFrame:
+    """Return the list of names available in a administrative layer using the name or the administrative code."""
+    return Names(name, admin, content_level, complete)
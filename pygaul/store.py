@@ -0,0 +1,187 @@
+"""Data store of the lib: the GAUL table and all the indexes built from it.
+
+A store builds each object on first use under a lock, so that concurrent requests wait for a single load of the table instead of racing to build it. Every request is pinned to the state of the store it started with: reloading a store builds a complete new state before swapping it, so that a request never mixes the table of a release with the indexes of another one.
+"""
+
+import itertools
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, Protocol, Union, cast
+
+from deprecated.sphinx import versionadded  # type: ignore [import-untyped]
+
+from . import __gaul_data__
+
+_TOKENS = itertools.count()
+"The generator of the unique identifiers of the store states."
+
+
+class _State:
+    """The objects built from a given parquet file, they are never modified once built."""
+
+    def __init__(self, path: Path, mmap: Optional[bool]):
+        self.path, self.mmap = path, mmap
+        self.token = next(_TOKENS)
+        self.objects: Dict[Hashable, Any] = {}
+        self.lock = threading.RLock()
+
+    def get(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """Get an object, build it on first use (only once even if several threads request it)."""
+        if key in self.objects:
+            return self.objects[key]
+
+        with self.lock:
+            if key not in self.objects:
+                self.objects[key] = self.call(build)
+
+        return self.objects[key]
+
+    def call(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a function with all its requests pinned to this state."""
+        with _activate(self):
+            return func(*args, **kwargs)
+
+
+_ACTIVE: ContextVar[Optional[_State]] = ContextVar("pygaul_store", default=None)
+"The state the running request is pinned to, None to use the state of the global store."
+
+
+@contextmanager
+def _activate(state: _State) -> Iterator[_State]:
+    """Pin the requests made in a block of code to a state."""
+    token = _ACTIVE.set(state)
+    try:
+        yield state
+    finally:
+        _ACTIVE.reset(token)
+
+
+@versionadded(version="0.5.0", reason="Add a data store owning the table and the indexes")
+class GaulStore:
+    def __init__(self, path: Union[str, Path] = "", mmap: Optional[bool] = None):
+        """Owner of the GAUL table and of all the indexes built from it.
+
+        :py:class:`Names`, :py:class:`Items` and the other functions of the lib use the global store (see :py:func:`get_store`) unless they are called in the :py:meth:`use` block of another store.
+
+        Args:
+            path: The parquet file of the GAUL database. Default to the database shipped with the lib.
+            mmap: Whether the table is read from a memory-mapped Arrow copy of the database. Default to the :code:`PYGAUL_MMAP` environment variable.
+        """
+        self._state = _State(Path(path) if path else __gaul_data__, mmap)
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        """The parquet file of the GAUL database."""
+        return self._state.path
+
+    @contextmanager
+    def use(self) -> Iterator["GaulStore"]:
+        """Make the requests of a block of code use this store instead of the global one."""
+        with _activate(self._state):
+            yield self
+
+    def warm(self) -> "GaulStore":
+        """Load the table and build all the indexes now instead of on the first requests.
+
+        Returns:
+            The store itself.
+        """
+        _warm(self._state)
+        return self
+
+    def reload(self, path: Union[str, Path] = ""):
+        """Load a new version of the GAUL database without interrupting the requests.
+
+        The table and the indexes of the new file are fully built before replacing the current ones. The requests started before the swap finish with the previous data and the memo caches of the lib are emptied.
+
+        Args:
+            path: The parquet file of the new database. Default to the current file.
+        """
+        from .memo import cache_clear
+
+        state = _State(Path(path) if path else self.path, self._state.mmap)
+        _warm(state)
+        with self._lock:
+            self._state = state
+        cache_clear()
+
+    def clear(self):
+        """Drop the table and the indexes, they will be built again on next use."""
+        with self._lock:
+            self._state = _State(self.path, self._state.mmap)
+
+
+def _warm(state: _State):
+    """Build all the objects of a state."""
+    from . import names
+
+    with _activate(state):
+        names._df()
+        names._tree()
+        names._continents()
+        for column in ["gaul{}_name", "gaul{}_code"]:
+            names._index(column)
+            names._keys(column)
+            names._letters(column)
+        names._index("gaul{}_name", True)
+        names._keys("gaul{}_name", True)
+
+
+_GLOBAL = GaulStore()
+"The store used by default."
+
+
+@versionadded(version="0.5.0", reason="Add a data store owning the table and the indexes")
+def get_store() -> GaulStore:
+    """Get the global store of the lib, used by all the requests made outside of a :py:meth:`GaulStore.use` block.
+
+    Returns:
+        The global store.
+    """
+    return _GLOBAL
+
+
+def _state() -> _State:
+    """Get the state used by the running request."""
+    return _ACTIVE.get() or _GLOBAL._state
+
+
+class _Stored(Protocol):
+    """A function whose results are kept in the store state (see :py:func:`stored`)."""
+
+    def __call__(self, *args: Any) -> Any: ...
+
+    def loaded(self, *args: Any) -> bool:
+        """Tell if the result of the function for these arguments is already built."""
+        ...
+
+
+def stored(func: Callable) -> _Stored:
+    """Keep the result of a function in the store state, keyed by its arguments.
+
+    The wrapper has a :code:`loaded` function telling if the result is already built.
+    """
+
+    @wraps(func)
+    def wrapper(*args):
+        return _state().get((func.__name__, *args), lambda: func(*args))
+
+    wrapper.loaded = lambda *args: (func.__name__, *args) in _state().objects  # type: ignore [attr-defined]
+
+    return cast(_Stored, wrapper)
+
+
+def pinned(func: Callable) -> Callable:
+    """Pin all the steps of a request to the state of the store at its start."""
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if _ACTIVE.get() is not None:
+            return func(*args, **kwargs)
+        return _GLOBAL._state.call(func, *args, **kwargs)
+
+    return wrapper
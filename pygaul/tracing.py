@@ -0,0 +1,152 @@
+"""Instrumentation of the lib.
+
+The table loading, the index building, the resolution of the areas, the suggestion search, the Earth Engine expression construction and the Earth Engine calls are wrapped in named spans. The spans are only timed when a hook is registered or when the statistics are enabled: otherwise they are a shared no-op context manager.
+"""
+
+import os
+import threading
+import time
+from contextlib import ExitStack, nullcontext
+from functools import wraps
+from typing import Any, Callable, ContextManager, Dict, List, NamedTuple, Optional, Tuple
+
+from deprecated.sphinx import versionadded  # type: ignore [import-untyped]
+
+_HOOKS: List[Callable[..., ContextManager]] = []
+"The functions opening a context for each span."
+
+_STATS: Dict[str, Tuple[int, float, float]] = {}
+"The count, total time and maximal time of each span."
+
+_LOCK = threading.Lock()
+"The lock protecting the statistics shared by the threads."
+
+_ENABLED = {"hooks": False, "stats": os.environ.get("PYGAUL_STATS", "0").lower() in ["1", "true"]}
+"The instrumentation surfaces in use, the spans are skipped when none is enabled."
+
+_NULL_SPAN = nullcontext()
+"The span used when the instrumentation is disabled."
+
+
+class SpanStats(NamedTuple):
+    """Statistics of the spans of a given name."""
+
+    count: int  # type: ignore [assignment] # the number of spans, it shadows tuple.count
+    total: float
+    max: float
+
+
+class _Span:
+    """Context timing a block of code and opening the context of each hook."""
+
+    def __init__(self, name: str, attributes: Dict[str, Any]):
+        self.name, self.attributes = name, attributes
+
+    def __enter__(self) -> "_Span":
+        self.contexts = ExitStack()
+        for hook in list(_HOOKS):
+            self.contexts.enter_context(hook(self.name, attributes=self.attributes))
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> Optional[bool]:
+        duration = time.perf_counter() - self.start
+        if _ENABLED["stats"]:
+            with _LOCK:
+                count, total, maximum = _STATS.get(self.name, (0, 0.0, 0.0))
+                _STATS[self.name] = (count + 1, total + duration, max(maximum, duration))
+
+        return self.contexts.__exit__(*exc_info)
+
+
+def span(name: str, **attributes: Any) -> ContextManager:
+    """Wrap a block of code in a span.
+
+    Args:
+        name: The name of the span.
+        attributes: The attributes given to the hooks, their values should be strings or numbers.
+
+    Returns:
+        The span context, a no-op one if the instrumentation is disabled.
+    """
+    if not (_ENABLED["hooks"] or _ENABLED["stats"]):
+        return _NULL_SPAN
+
+    return _Span(name, attributes)
+
+
+def traced(name: str) -> Callable[[Callable], Callable]:
+    """Wrap each call of a function in a span.
+
+    Args:
+        name: The name of the span. The positional arguments of the call that are strings or numbers are given as the :code:`args` attribute.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not (_ENABLED["hooks"] or _ENABLED["stats"]):
+                return func(*args, **kwargs)
+            scalars = [str(a) for a in args if isinstance(a, (str, int, float))]
+            with _Span(name, {"args": ", ".join(scalars)}):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@versionadded(version="0.5.0", reason="Add instrumentation hooks and statistics")
+def add_hook(hook: Callable[..., ContextManager]):
+    """Register a function opening a context around each span of the lib.
+
+    The hook is called as :code:`hook(name, attributes=attributes)` when a span starts and the context it returns is exited when the span ends. The :code:`start_as_current_span` method of an OpenTelemetry tracer follows this protocol.
+
+    Args:
+        hook: The function returning the context of a span.
+    """
+    with _LOCK:
+        _HOOKS.append(hook)
+        _ENABLED["hooks"] = True
+
+
+@versionadded(version="0.5.0", reason="Add instrumentation hooks and statistics")
+def remove_hook(hook: Callable[..., ContextManager]):
+    """Unregister a hook added with :py:func:`add_hook`.
+
+    Args:
+        hook: The registered function.
+    """
+    with _LOCK:
+        _HOOKS.remove(hook)
+        _ENABLED["hooks"] = len(_HOOKS) > 0
+
+
+@versionadded(version="0.5.0", reason="Add instrumentation hooks and statistics")
+def enable_stats(enabled: bool = True):
+    """Start or stop counting and timing the spans of the lib.
+
+    The statistics are disabled by default, they can also be enabled with the :code:`PYGAUL_STATS` environment variable set to :code:`1`.
+
+    Args:
+        enabled: Whether the spans are counted. Default to True.
+    """
+    _ENABLED["stats"] = enabled
+
+
+@versionadded(version="0.5.0", reason="Add instrumentation hooks and statistics")
+def stats(reset: bool = False) -> Dict[str, SpanStats]:
+    """Get the statistics of the spans of the lib since they were enabled.
+
+    Args:
+        reset: If True, the statistics are set back to zero after being read. Default to False.
+
+    Returns:
+        The number of spans, their total and their maximal durations in seconds by span name.
+    """
+    with _LOCK:
+        result = {name: SpanStats(*values) for name, values in sorted(_STATS.items())}
+        if reset:
+            _STATS.clear()
+
+    return result
@@ -1,8 +1,99 @@
 """Pytest session configuration."""
 
+import json
+import re
+import threading
+import time
+
+import ee
+import pytest
 import pytest_gee
 
+import pygaul
+from pygaul import names
+
 
 def pytest_configure():
     """Initialize GEE from service account."""
     pytest_gee.init_ee_from_service_account()
+
+
+class FakeEarthEngine:
+    """In-process stand-in for the Earth Engine server.
+
+    It answers the requests of the GAUL features with a 1 degree square per requested code and records the level, the codes and the expression of each request and the peak number of requests in flight. It can simulate the latency of the server, its payload limit and transient errors.
+    """
+
+    def __init__(self):
+        """Start with no recorded request, no latency and no limit."""
+        self.requests: list = []
+        self.expressions: list = []
+        self.latency = 0.0
+        self.max_features = 0
+        self.failures = 0
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def compute_value(self, obj: ee.ComputedObject) -> dict:
+        """Replace ``ee.data.computeValue`` for the features filtered by code."""
+        expression = obj.serialize()
+        level = int(re.search(r"GAUL_2024_L(\d)", expression).group(1))
+
+        # the parents filters select all their areas of the requested level
+        codes: list = []
+        filters = re.finditer(
+            r'"leftValue": {"constantValue": (\[[^\]]*\])}, '
+            r'"rightField": {"constantValue": "gaul(\d)_code"}',
+            expression,
+        )
+        for match in filters:
+            values, filter_level = json.loads(match.group(1)), int(match.group(2))
+            for value in values:
+                areas = [value] if filter_level == level else pygaul.children(value, level)
+                codes += [int(c) for c in areas]
+
+        with self._lock:
+            self.requests.append((level, codes))
+            self.expressions.append(expression)
+            failure, self.failures = self.failures > 0, max(self.failures - 1, 0)
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+
+        time.sleep(self.latency)
+        with self._lock:
+            self.in_flight -= 1
+
+        if failure:
+            raise ee.EEException("Too many concurrent aggregations.")
+        if 0 < self.max_features < len(codes):
+            msg = f"Collection query aborted after accumulating over {self.max_features} elements."
+            raise ee.EEException(msg)
+
+        return {"type": "FeatureCollection", "features": [self.feature(level, c) for c in codes]}
+
+    @staticmethod
+    def feature(level: int, code: int) -> dict:
+        """Build the feature of an area, with the codes of its parents if it is in the database."""
+        x, y = code % 170, code // 170 % 80
+        coordinates = [[[x, y], [x + 1, y], [x + 1, y + 1], [x, y + 1], [x, y]]]
+        properties, parent_codes, parent = {f"gaul{level}_code": code}, names._tree()[2], code
+        for parent_level in range(level - 1, -1, -1):
+            if (parent := parent_codes.get(parent, -1)) == -1:
+                break
+            properties[f"gaul{parent_level}_code"] = parent
+
+        return {
+            "type": "Feature",
+            "id": str(code),
+            "geometry": {"type": "Polygon", "coordinates": coordinates},
+            "properties": properties,
+        }
+
+
+@pytest.fixture
+def fake_ee(monkeypatch) -> FakeEarthEngine:
+    """Answer the Earth Engine requests with the fake server."""
+    backend = FakeEarthEngine()
+    monkeypatch.setattr(ee.data, "computeValue", backend.compute_value)
+    return backend
@@ -0,0 +1,64 @@
+"""Tests of the async API."""
+
+import asyncio
+
+import pytest
+
+import pygaul
+
+
+def test_fetch(fake_ee):
+    """Request the boundaries of an Items object."""
+    fc = pygaul.Items(admin="301", content_level=1)
+    geojson = asyncio.run(fc.fetch_async())
+    codes = [f["properties"]["gaul1_code"] for f in geojson["features"]]
+    assert codes == fc._codes[1]
+
+
+def test_aitems_errors(fake_ee):
+    """Resolve the names before calling Earth Engine."""
+    with pytest.raises(ValueError):
+        asyncio.run(pygaul.aitems(name="t0t0"))
+
+    assert fake_ee.requests == []
+
+
+def test_concurrency(fake_ee):
+    """Run the requests concurrently."""
+    fake_ee.latency = 0.2
+
+    async def main():
+        return await asyncio.gather(*[pygaul.aitems(admin=a) for a in ["301", "101", "105"]])
+
+    results = asyncio.run(main())
+    assert fake_ee.peak == 3
+    assert [r["features"][0]["properties"]["gaul0_code"] for r in results] == [301, 101, 105]
+
+
+def test_limit(fake_ee, monkeypatch):
+    """Limit the number of requests in flight."""
+    monkeypatch.setenv("PYGAUL_ASYNC_LIMIT", "1")
+    fake_ee.latency = 0.1
+
+    async def main():
+        await asyncio.gather(*[pygaul.aitems(admin=a) for a in ["301", "101", "105"]])
+
+    asyncio.run(main())
+    assert fake_ee.peak == 1
+    assert len(fake_ee.requests) == 3
+
+
+def test_cancel(fake_ee, monkeypatch):
+    """Cancel the requests waiting for a slot."""
+    monkeypatch.setenv("PYGAUL_ASYNC_LIMIT", "1")
+    fake_ee.latency = 0.2
+
+    async def main():
+        tasks = [asyncio.create_task(pygaul.aitems(admin=a)) for a in ["301", "101", "105"]]
+        await asyncio.sleep(0.05)
+        [task.cancel() for task in tasks]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    results = asyncio.run(main())
+    assert all(isinstance(r, asyncio.CancelledError) for r in results)
+    assert fake_ee.requests == [(0, [301])]
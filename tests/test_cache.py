@@ -0,0 +1,53 @@
+"""Tests of the geometry cache."""
+
+import ee
+import pytest
+
+import pygaul
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """A geometry cache in a temporary directory."""
+    return pygaul.GeometryCache(tmp_path)
+
+
+def test_to_geodataframe(fake_ee):
+    """Download the boundaries of several areas."""
+    gdf = pygaul.Items(name=["France", "Germany", "Corse-du-Sud"]).to_geodataframe()
+    assert gdf.crs == "EPSG:4326"
+    assert gdf.gaul0_code.to_list() == [301, 303, 301]
+    assert gdf.gaul2_code.dropna().to_list() == [135345]
+    assert fake_ee.requests == [(0, [301, 303]), (2, [135345])]
+
+
+def test_no_features(fake_ee, cache, monkeypatch):
+    """Get an empty GeoDataFrame when Earth Engine returns no feature."""
+    empty = {"type": "FeatureCollection", "features": []}
+    monkeypatch.setattr(ee.data, "computeValue", lambda obj: empty)
+    gdf = pygaul.Items(name="France").to_geodataframe(cache=cache)
+    assert len(gdf) == 0
+    assert gdf.crs == "EPSG:4326"
+
+
+def test_cache_hits(fake_ee, cache):
+    """Only the areas missing from the cache are downloaded."""
+    pygaul.Items(name=["France", "Germany"]).to_geodataframe(cache=cache)
+    gdf = pygaul.Items(name=["Italy", "France", "Germany"]).to_geodataframe(cache=cache)
+    assert gdf.gaul0_code.to_list() == [312, 301, 303]
+    assert fake_ee.requests == [(0, [301, 303]), (0, [312])]
+
+
+def test_eviction(fake_ee, cache):
+    """The least recently used areas are removed when the cache is full."""
+    pygaul.Items(name="France").to_geodataframe(cache=cache)
+    size = next(cache.directory.glob("L0/*.parquet")).stat().st_size
+    cache.max_size = 2.5 * size / 2**20
+
+    pygaul.Items(name="Germany").to_geodataframe(cache=cache)
+    pygaul.Items(name="France").to_geodataframe(cache=cache)
+    pygaul.Items(name="Italy").to_geodataframe(cache=cache)
+    assert sorted(f.stem for f in cache.directory.glob("L0/*.parquet")) == ["301", "312"]
+
+    cache.clear()
+    assert list(cache.directory.glob("L0/*.parquet")) == []
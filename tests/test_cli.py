@@ -0,0 +1,83 @@
+"""Tests of the command line interface."""
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from pygaul.cli import main
+
+
+@pytest.fixture
+def regions(tmp_path):
+    """A CSV file of names with a misspelled and an empty value."""
+    file = tmp_path / "regions.csv"
+    values = ["France", "Franc", "Singapore", "", "France", "Abidjan"]
+    pd.DataFrame({"id": range(len(values)), "region": values}).to_csv(file, index=False)
+    return file
+
+
+def test_csv(regions, tmp_path, capsys):
+    """Annotate a CSV file by small chunks."""
+    output = tmp_path / "output.csv"
+    assert main(["resolve", str(regions), str(output), "-c", "region", "--chunk-size", "4"]) == 0
+
+    df = pd.read_csv(output, dtype=str, keep_default_na=False)
+    assert df.id.to_list() == ["0", "1", "2", "3", "4", "5"]
+    assert df.gaul0_code.to_list() == ["301", "", "269", "", "301", "117"]
+    assert df.level.to_list() == ["0", "-1", "0", "-1", "0", "1"]
+    assert df.status.to_list()[:2] == ["found", "not found"]
+    assert df.suggestions[1].split("|")[0] == "France"
+    assert df.suggestions[3] == ""
+    assert "rows/s" in capsys.readouterr().err
+
+
+def test_parquet_workers(tmp_path):
+    """Annotate a Parquet file of codes with several processes."""
+    source, output = tmp_path / "codes.parquet", tmp_path / "output.parquet"
+    pd.DataFrame({"code": ["301", "3431", "t0t0"] * 5}).to_parquet(source)
+    args = ["resolve", str(source), str(output), "-c", "code", "--admin", "--chunk-size", "2"]
+    assert main([*args, "--workers", "2", "--suggestions", "0", "--quiet"]) == 0
+
+    df = pd.read_parquet(output)
+    assert "suggestions" not in df.columns
+    assert df.gaul0_code.to_list() == ["301", "301", ""] * 5
+    assert df.level.to_list() == [0, 1, -1] * 5
+
+
+@pytest.mark.parametrize("metadata", [True, False])
+def test_parquet_integers(tmp_path, metadata):
+    """Annotate a Parquet file of integer codes with nulls, read as Int64 or as floats."""
+    source, output = tmp_path / "codes.parquet", tmp_path / "output.csv"
+    codes = pd.DataFrame({"code": pd.array([301, None, 3431], dtype="Int64")})
+    table = pa.Table.from_pandas(codes) if metadata else pa.table({"code": [301, None, 3431]})
+    pq.write_table(table, source)
+    assert main(["resolve", str(source), str(output), "-c", "code", "--admin", "-q"]) == 0
+
+    df = pd.read_csv(output, dtype=str, keep_default_na=False)
+    assert df.status.to_list() == ["found", "not found", "found"]
+    assert df.gaul0_code.to_list() == ["301", "", "301"]
+    assert df.level.to_list() == ["0", "-1", "1"]
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet"])
+def test_empty(tmp_path, suffix):
+    """Write the result columns of an input without rows."""
+    source, output = tmp_path / f"empty{suffix}", tmp_path / f"output{suffix}"
+    empty = pd.DataFrame({"region": pd.Series([], dtype=str)})
+    if suffix == ".csv":
+        empty.to_csv(source, index=False)
+    else:
+        empty.to_parquet(source)
+    assert main(["resolve", str(source), str(output), "-c", "region", "-q"]) == 0
+
+    df = pd.read_csv(output) if suffix == ".csv" else pd.read_parquet(output)
+    assert len(df) == 0
+    assert df.columns.to_list()[:2] == ["region", "level"]
+    assert df.columns.to_list()[-2:] == ["status", "suggestions"]
+
+
+def test_missing_column(regions, tmp_path):
+    """Request a column absent from the file."""
+    with pytest.raises(KeyError):
+        main(["resolve", str(regions), str(tmp_path / "output.csv"), "-c", "t0t0"])
@@ -7,3 +7,31 @@ def test_continent(data_regression):
     """Check that the continent are working."""
     fc = pygaul.Items(name="Africa")
     data_regression.check(fc.aggregate_array("gaul0_name").getInfo())
+
+
+def test_continent_expression():
+    """Check that a continent is requested with a single filter on the country asset."""
+    expression = pygaul.Items(name="Africa").serialize()
+    assert expression.count("Collection.loadTable") == 1
+    assert expression.count("Collection.merge") == 0
+    assert len(expression) < 2000
+
+
+def test_continent_names():
+    """Request the countries of a continent by name."""
+    df = pygaul.Names(name="europe")
+    world = pygaul.Names(complete=True)
+    assert df.gaul0_code.to_list() == world[world.continent == "europe"].gaul0_code.to_list()
+
+    df = pygaul.Names(name="Europe", content_level=1)
+    assert set(df.gaul1_code) >= set(pygaul.Names(admin="301", content_level=1).gaul1_code)
+
+
+def test_continent_mixed():
+    """Request a continent along with other areas."""
+    fc = pygaul.Items(name=["Oceania", "France"])
+    oceania = pygaul.Names(name="Oceania").gaul0_code.to_list()
+    assert fc._codes == {0: [int(c) for c in oceania] + [301]}
+
+    fc = pygaul.Items(name=["Oceania", "Corse-du-Sud"])
+    assert list(fc._codes) == [0, 2]
@@ -0,0 +1,53 @@
+"""Tests of the download engine."""
+
+import ee
+import pytest
+
+from pygaul.download import download
+
+CODES = list(range(100001, 100021))
+
+
+def test_chunks(fake_ee):
+    """The codes are requested by chunks and returned in the requested order."""
+    gdf = download(2, CODES[::-1], chunk_size=6)
+    assert gdf.gaul2_code.to_list() == CODES[::-1]
+    assert sorted(len(codes) for _, codes in fake_ee.requests) == [2, 6, 6, 6]
+
+
+def test_concurrency(fake_ee):
+    """The chunks are requested concurrently."""
+    fake_ee.latency = 0.2
+    download(2, CODES, chunk_size=5, workers=4)
+    assert fake_ee.peak == 4
+
+
+def test_payload_limit(fake_ee):
+    """The chunks that are too big for the server are split."""
+    fake_ee.max_features = 3
+    gdf = download(2, CODES, chunk_size=8)
+    assert gdf.gaul2_code.to_list() == CODES
+    assert max(len(codes) for _, codes in fake_ee.requests) == 8
+    assert len(fake_ee.requests) > 3
+
+
+def test_retry(fake_ee):
+    """Transient errors are retried."""
+    fake_ee.failures = 2
+    gdf = download(2, CODES, chunk_size=20, backoff=0)
+    assert len(gdf) == 20
+    assert len(fake_ee.requests) == 3
+
+
+def test_retry_exhausted(fake_ee):
+    """The error is raised when all the retries failed."""
+    fake_ee.failures = 3
+    with pytest.raises(ee.EEException):
+        download(2, CODES, chunk_size=20, retries=2, backoff=0)
+
+
+def test_progress(fake_ee):
+    """The progress is reported after each chunk."""
+    calls = []
+    download(2, CODES, chunk_size=5, progress=lambda done, total: calls.append((done, total)))
+    assert calls == [(5, 20), (10, 20), (15, 20), (20, 20)]
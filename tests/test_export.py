@@ -0,0 +1,79 @@
+"""Tests of the export of the boundaries to files."""
+
+import geopandas as gpd
+import pyarrow.parquet as pq
+import pytest
+from shapely import Point
+
+import pygaul
+from pygaul.download import _GeoParquetWriter
+
+
+def test_parquet(fake_ee, tmp_path):
+    """Stream the chunks of a country as the row groups of a GeoParquet file."""
+    items = pygaul.Items(admin="301", content_level=1)
+    calls = []
+    file = items.export(
+        tmp_path / "france.parquet", chunk_size=5, progress=lambda *a: calls.append(a)
+    )
+
+    gdf = gpd.read_parquet(file)
+    assert gdf.crs == "EPSG:4326"
+    assert sorted(gdf.gaul1_code) == sorted(items._codes[1])
+    assert set(gdf.gaul0_code) == {301}
+    assert pq.ParquetFile(file).metadata.num_row_groups == len(fake_ee.requests)
+    assert calls[-1] == (len(items._codes[1]), len(items._codes[1]))
+    assert list(tmp_path.iterdir()) == [file]
+
+
+def test_simplify(fake_ee, tmp_path):
+    """Simplify the geometries in Earth Engine before the transfer."""
+    pygaul.Items(admin="301").export(tmp_path / "france.parquet", max_error=100)
+    assert "Feature.simplify" in fake_ee.expressions[0]
+
+    pygaul.Items(admin="301").export(tmp_path / "exact.parquet")
+    assert "Feature.simplify" not in fake_ee.expressions[1]
+
+
+def test_levels(fake_ee, tmp_path):
+    """Export areas of several levels in the same file."""
+    file = pygaul.Items(admin=["312", "3431"]).export(tmp_path / "areas.parquet")
+    gdf = gpd.read_parquet(file)
+    assert gdf.gaul0_code.to_list() == [301, 312]
+    assert gdf.gaul1_code.fillna(-1).to_list() == [3431, -1]
+
+
+@pytest.mark.parametrize("name", ["france.geojson", "france.gpkg"])
+def test_formats(fake_ee, tmp_path, name):
+    """Export the boundaries with the other formats of geopandas."""
+    items = pygaul.Items(admin="301", content_level=1)
+    gdf = gpd.read_file(items.export(tmp_path / name, chunk_size=10))
+    assert sorted(gdf.gaul1_code) == sorted(items._codes[1])
+
+
+def test_errors(fake_ee, tmp_path):
+    """Leave no file when the format is unknown or the download fails."""
+    with pytest.raises(ValueError, match="format"):
+        pygaul.Items(admin="301").export(tmp_path / "france.txt")
+
+    fake_ee.failures = 10
+    with pytest.raises(Exception, match="concurrent"):
+        pygaul.Items(admin="301").export(tmp_path / "france.parquet", retries=0)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_schema(tmp_path):
+    """Write the chunks with properties missing or integer in the first one."""
+    file = tmp_path / "areas.parquet"
+    writer = _GeoParquetWriter(file)
+    for properties in [
+        {"gaul0_code": [301], "disp_en": [None], "shape_area": [2]},
+        {"gaul0_code": [312], "disp_en": ["disputed"], "shape_area": [1.5]},
+    ]:
+        writer.write(gpd.GeoDataFrame(properties, geometry=[Point(0, 0)], crs="EPSG:4326"))
+    writer.close()
+
+    gdf = gpd.read_parquet(file)
+    assert gdf.gaul0_code.to_list() == [301, 312]
+    assert gdf.disp_en.fillna("").to_list() == ["", "disputed"]
+    assert gdf.shape_area.to_list() == [2.0, 1.5]
@@ -0,0 +1,76 @@
+"""Tests of the spatial filters using the extents of the areas."""
+
+import geopandas as gpd
+import pytest
+
+import pygaul
+from pygaul import extents
+
+from .conftest import FakeEarthEngine
+
+
+def squares(level: int, codes: list) -> gpd.GeoDataFrame:
+    """Build the squares of the fake Earth Engine server for some areas."""
+    features = [FakeEarthEngine.feature(level, int(c)) for c in codes]
+    return gpd.GeoDataFrame.from_features(features, crs="EPSG:4326")
+
+
+@pytest.fixture
+def built(tmp_path, monkeypatch):
+    """Build the extents of France and Italy (level 0) and of the regions of France (level 1)."""
+    monkeypatch.setenv("PYGAUL_CACHE_DIR", str(tmp_path))
+    regions = pygaul.Names(admin="301", content_level=1).gaul1_code
+    pygaul.cache_clear()
+    yield pygaul.build_extents({0: squares(0, [301, 312]), 1: squares(1, regions)})
+    pygaul.cache_clear()
+
+
+def test_missing(tmp_path, monkeypatch):
+    """Explain how to build the extents."""
+    monkeypatch.setenv("PYGAUL_CACHE_DIR", str(tmp_path))
+    with pytest.raises(ValueError, match="build_extents"):
+        pygaul.Names(bbox=(0, 0, 1, 1))
+
+
+def test_bbox(built):
+    """Filter the areas overlapping a bounding box."""
+    assert built.exists()
+    assert pygaul.Names(bbox=(130, 0, 133, 3)).gaul0_code.to_list() == ["301"]
+    assert pygaul.Names(bbox=(130, 0, 143, 3)).gaul0_code.to_list() == ["301", "312"]
+    assert pygaul.Names(bbox=(140, 0, 135, 3)).gaul0_code.to_list() == ["301", "312"]
+    assert len(pygaul.Names(bbox=(0, 0, 1, 1))) == 0
+
+    code = int(pygaul.Names(admin="301", content_level=1).gaul1_code[0])
+    x, y = code % 170, code // 170 % 80
+    df = pygaul.Names(name="France", content_level=1, bbox=(x + 0.2, y + 0.2, x + 0.8, y + 0.8))
+    assert df.gaul1_code.to_list() == [str(code)]
+
+
+def test_centroids(built):
+    """Store the centroid of each area along its bounding box."""
+    france = extents._extents()[0]
+    i = list(france["code"]).index(301)
+    assert (france["cx"][i], france["cy"][i]) == (131.5, 1.5)
+
+
+def test_around(built):
+    """Filter the areas close to a point."""
+    assert pygaul.Names(around=(131.5, 1.5, 10)).gaul0_code.to_list() == ["301"]
+    assert len(pygaul.Names(around=(135, 1.5, 100))) == 0
+    assert pygaul.Names(around=(135, 1.5, 400)).gaul0_code.to_list() == ["301"]
+
+
+def test_store(built, tmp_path, monkeypatch):
+    """Keep the extents in the store and read them again from a new cache directory."""
+    assert set(extents._extents()) == {0, 1}
+    store = pygaul.GaulStore()
+    with store.use():
+        extents._extents()
+        assert extents._read_extents.loaded(str(built), built.stat().st_mtime_ns)
+    store.clear()
+    with store.use():
+        assert not extents._read_extents.loaded(str(built), built.stat().st_mtime_ns)
+
+    monkeypatch.setenv("PYGAUL_CACHE_DIR", str(tmp_path / "other"))
+    pygaul.build_extents({0: squares(0, [301])})
+    assert set(extents._extents()) == {0}
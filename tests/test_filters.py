@@ -0,0 +1,69 @@
+"""Tests of the Earth Engine filters of the requested areas."""
+
+import ee
+
+import pygaul
+from pygaul.download import download
+from pygaul.items import _groups
+
+
+def test_continent(fake_ee):
+    """Request all the districts of a continent by the codes of its countries."""
+    fc = pygaul.Items(name="africa", content_level=2)
+    assert len(fc.serialize()) < 2000
+
+    features = fc.getInfo()["features"]
+    codes = [f["properties"]["gaul2_code"] for f in features]
+    assert sorted(codes) == sorted(fc._codes[2])
+    assert len(codes) > 5000
+    assert len(fake_ee.expressions[0]) < 2000
+
+
+def test_country():
+    """Request all the regions of a country by its code."""
+    regions = [int(c) for c in pygaul.children("301")]
+    assert _groups(1, regions) == {0: [301]}
+    assert _groups(2, [int(c) for c in pygaul.descendants("3431")]) == {1: [3431]}
+
+
+def test_partial():
+    """Request some regions of a country by their codes."""
+    regions = [int(c) for c in pygaul.children("301")]
+    assert _groups(1, regions[:-1]) == {1: regions[:-1]}
+    assert _groups(0, [301, 312]) == {0: [301, 312]}
+    assert _groups(2, []) == {2: []}
+
+
+def test_mixed(fake_ee):
+    """Request a whole country and a single region of another one."""
+    italy = int(pygaul.children("312")[0])
+    fc = pygaul.Items(admin=["301", str(italy)], content_level=1)
+    assert _groups(1, fc._codes[1]) == {0: [301], 1: [italy]}
+
+    features = fc.getInfo()["features"]
+    codes = {f["properties"]["gaul1_code"] for f in features}
+    assert codes == set(fc._codes[1])
+
+
+def test_download(fake_ee):
+    """Download a whole country in a single small request."""
+    regions = [int(c) for c in pygaul.children("301")]
+    gdf = download(1, regions, chunk_size=len(regions))
+    assert gdf.gaul1_code.to_list() == regions
+    assert fake_ee.requests == [(1, regions)]
+    assert len(fake_ee.expressions[0]) < 600
+
+
+def test_unknown_areas(fake_ee, monkeypatch):
+    """Keep the areas of a requested parent that are missing from the local database."""
+    compute_value = fake_ee.compute_value
+
+    def with_extra_area(obj):
+        result = compute_value(obj)
+        result["features"].insert(0, fake_ee.feature(1, 999999))
+        return result
+
+    monkeypatch.setattr(ee.data, "computeValue", with_extra_area)
+    regions = [int(c) for c in pygaul.children("301")]
+    gdf = download(1, regions, chunk_size=len(regions))
+    assert gdf.gaul1_code.to_list() == [*regions, 999999]
@@ -105,3 +105,12 @@ def test_adm_items():
         fc2 = pygaul.get_items(name="Singapore")
         ids2 = fc2.aggregate_array("system:index").sort()
         assert ids1.equals(ids2).getInfo()
+
+
+def test_multiple_levels_expression():
+    """Check that areas from different levels are merged once per level."""
+    fc = pygaul.Items(name=["France", "Singapore", "Bukit Timah", "Corse-du-Sud", "france"])
+    expression = fc.serialize()
+    assert expression.count("Collection.loadTable") == 3
+    assert expression.count("Collection.merge") == 2
+    assert "[301, 269]" in expression
@@ -0,0 +1,52 @@
+"""Tests of the hierarchy functions."""
+
+import pytest
+
+import pygaul
+
+
+def test_non_existing():
+    """Request non existing area."""
+    with pytest.raises(ValueError):
+        pygaul.children("t0t0")
+
+    with pytest.raises(ValueError):
+        pygaul.parents("t0t0")
+
+
+def test_children():
+    """Request the direct children of a country."""
+    assert pygaul.children("269") == pygaul.Names(admin="269", content_level=1).gaul1_code.to_list()
+
+
+def test_children_level():
+    """Request the children of a specific level."""
+    assert (
+        pygaul.children(301, level=2)
+        == pygaul.Names(admin="301", content_level=2).gaul2_code.to_list()
+    )
+    assert pygaul.children("135345") == []
+
+    with pytest.raises(ValueError):
+        pygaul.children("3435", level=1)
+
+    with pytest.raises(ValueError, match="does not exist"):
+        pygaul.children("301", level=5)
+
+
+def test_strip():
+    """Request an area with surrounding spaces like Names does."""
+    assert pygaul.children(" 301") == pygaul.children("301")
+    assert pygaul.parents("130587 ") == ["269", "2968"]
+
+
+def test_parents():
+    """Request the parents of an area."""
+    assert pygaul.parents("130587") == ["269", "2968"]
+    assert pygaul.parents("269") == []
+
+
+def test_descendants():
+    """Request all the areas included in an area."""
+    assert pygaul.descendants("3435") == ["135345", "135346"]
+    assert len(pygaul.descendants("269")) == 18
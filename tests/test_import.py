@@ -0,0 +1,44 @@
+"""Tests of the lib import time."""
+
+import subprocess
+import sys
+
+IMPORT_BUDGET = 0.1
+"Maximal time to import the lib in seconds."
+
+
+def _run(code: str) -> subprocess.CompletedProcess:
+    """Run some code in a fresh interpreter to start from an empty module cache."""
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True
+    )
+
+
+def test_import_time():
+    """Check the import of the lib stays within the budget."""
+    lines = _run("import pygaul").stderr.splitlines()
+    line = next(li for li in lines if li.split("|")[-1].strip() == "pygaul")
+    cumulative = int(line.split("|")[1]) / 1e6
+    assert cumulative < IMPORT_BUDGET
+
+
+def test_lazy_dependencies():
+    """Check that the heavy dependencies are only imported when needed."""
+    modules = "print(' '.join(m for m in ['ee', 'pandas', 'deprecated'] if m in sys.modules))"
+    assert _run(f"import sys, pygaul; {modules}").stdout.split() == []
+    assert _run(f"import sys, pygaul; pygaul.Names; {modules}").stdout.split() == [
+        "pandas",
+        "deprecated",
+    ]
+    assert _run(f"import sys, pygaul; pygaul.Items; {modules}").stdout.split() == [
+        "ee",
+        "pandas",
+        "deprecated",
+    ]
+
+
+def test_without_geo():
+    """Check that all the public objects can be imported without the optional geo dependencies."""
+    blocked = "import sys; sys.modules.update(geopandas=None, shapely=None)"
+    result = _run(f"{blocked}; from pygaul import *; print(GeometryCache, Locator, locate)")
+    assert "Locator" in result.stdout
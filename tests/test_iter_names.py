@@ -0,0 +1,41 @@
+"""Tests of the names iterator."""
+
+import pandas as pd
+
+import pygaul
+
+
+def sort(df: pd.DataFrame) -> pd.DataFrame:
+    """Sort the lines of a names DataFrame by their content."""
+    return pd.DataFrame(df).sort_values(list(df.columns), ignore_index=True)
+
+
+def test_world():
+    """Stream the same names as the world listing."""
+    df = pd.concat(pygaul.iter_names(level=1, batch_size=1000), ignore_index=True)
+    assert sort(df).equals(sort(pygaul.Names(content_level=1)))
+
+
+def test_complete():
+    """Stream all the columns."""
+    df = pd.concat(pygaul.iter_names(level=0, complete=True), ignore_index=True)
+    assert sort(df).equals(sort(pygaul.Names(complete=True)))
+
+
+def test_batch_size():
+    """Yield bounded batches."""
+    batches = list(pygaul.iter_names(level=2, batch_size=5000))
+    assert len(batches) > 1
+    assert all(0 < len(batch) <= 5000 for batch in batches)
+
+
+def test_filters():
+    """Filter the names by continent and country."""
+    df = pd.concat(pygaul.iter_names(level=1, continent="Europe", country=[301, "312"]))
+    world = pygaul.Names(content_level=1, complete=True)
+    expected = world[world.gaul0_code.isin(["301", "312"])].gaul1_code
+    assert sorted(df.gaul1_code) == sorted(expected)
+
+    df = pd.concat(pygaul.iter_names(continent=["Africa", "europe"]))
+    assert len(df) == 70 + 57
+    assert list(pygaul.iter_names(continent="Europe", country=101)) == []
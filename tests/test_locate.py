@@ -0,0 +1,51 @@
+"""Tests of the reverse geocoding engine."""
+
+import geopandas as gpd
+import numpy as np
+import pytest
+
+import pygaul
+
+from .conftest import FakeEarthEngine
+
+
+@pytest.fixture
+def regions() -> gpd.GeoDataFrame:
+    """The level 1 areas of France as the squares of the fake Earth Engine server."""
+    codes = [int(c) for c in pygaul.Names(admin="301", content_level=1).gaul1_code]
+    features = [FakeEarthEngine.feature(1, c) for c in codes]
+    return gpd.GeoDataFrame.from_features(features, crs="EPSG:4326")
+
+
+def test_locate(regions):
+    """Locate points inside, on the border and outside of the areas."""
+    code = regions.gaul1_code.iloc[0]
+    x, y = code % 170, code // 170 % 80
+    df = pygaul.locate([x + 0.5, x, -170], [y + 0.5, y + 0.5, -80], level=1, geometries=regions)
+
+    assert df.columns.to_list() == ["gaul0_code", "gaul1_code"]
+    assert df.gaul1_code.to_list()[::2] == [code, -1]
+    assert df.gaul1_code[1] in [code, code - 1]
+    assert df.gaul0_code.to_list()[::2] == [301, -1]
+
+
+def test_file(regions, tmp_path):
+    """Read the boundaries from a file and locate points by chunks."""
+    file = tmp_path / "regions.parquet"
+    regions.to_parquet(file)
+    x, y = regions.gaul1_code % 170 + 0.5, regions.gaul1_code // 170 % 80 + 0.5
+
+    df = pygaul.Locator(level=1, geometries=file).locate(x, y, chunk_size=3)
+    assert (df.gaul1_code == regions.gaul1_code).all()
+
+
+def test_download(fake_ee, tmp_path, monkeypatch):
+    """Download the boundaries once."""
+    monkeypatch.setenv("PYGAUL_CACHE_DIR", str(tmp_path))
+    pygaul.Locator(level=1, admin="301")
+    locator = pygaul.Locator(level=1, admin="301")
+    assert len(fake_ee.requests) == 1
+
+    codes = locator.codes
+    df = locator.locate(codes % 170 + 0.5, codes // 170 % 80 + 0.5)
+    assert np.array_equal(df.gaul1_code.to_numpy(), codes)
@@ -0,0 +1,97 @@
+"""Tests of the memoization of the requests."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import pygaul
+
+
+@pytest.fixture(autouse=True)
+def empty_memo():
+    """Start each test with empty memo caches and restore their size."""
+    pygaul.cache_clear()
+    yield
+    pygaul.set_cache_size(128)
+    pygaul.cache_clear()
+
+
+def test_names_hit():
+    """Request the same area with different spellings."""
+    df = pygaul.Names(name="France", content_level=1)
+    assert pygaul.cache_info()["names"].misses == 1
+
+    df_hit = pygaul.Names(name="  fRANCE ", content_level=1)
+    assert pygaul.cache_info()["names"].hits == 1
+    assert type(df_hit) is pygaul.Names
+    assert df_hit.equals(df)
+
+    pygaul.Names(name="France", content_level=2)
+    assert pygaul.cache_info()["names"].misses == 2
+
+
+def test_names_copy():
+    """Modify a result without altering the cached one."""
+    df = pygaul.Names(admin="301")
+    df.loc[0, "gaul0_name"] = "t0t0"
+    df["new"] = 1
+
+    df_hit = pygaul.Names(admin="301")
+    assert df_hit.gaul0_name.to_list() == ["France"]
+    assert df_hit.columns.to_list() == ["gaul0_name", "gaul0_code"]
+
+
+def test_names_warnings():
+    """Raise the warnings of a cached request again."""
+    with pytest.warns(UserWarning):
+        pygaul.Names(admin="2658", content_level=0)
+
+    with pytest.warns(UserWarning):
+        pygaul.Names(admin="2658", content_level=0)
+
+    assert pygaul.cache_info()["names"].hits == 1
+
+
+def test_errors_not_cached():
+    """Request non existing areas."""
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            pygaul.Names(name="t0t0")
+
+    assert pygaul.cache_info()["names"].currsize == 0
+
+
+def test_items_expression():
+    """Reuse the expression of an identical request."""
+    fc = pygaul.Items(admin="301", content_level=1)
+    fc_hit = pygaul.Items(admin=" 301", content_level=1)
+
+    assert pygaul.cache_info()["items"].hits == 1
+    assert fc_hit.args == fc.args
+    assert fc_hit._codes == fc._codes
+    assert fc_hit._codes is not fc._codes
+
+
+def test_cache_size():
+    """Keep only the most recently used requests."""
+    pygaul.set_cache_size(2)
+    for admin in ["301", "101", "301", "105", "301"]:
+        pygaul.Names(admin=admin)
+
+    assert pygaul.cache_info()["names"] == (2, 3, 2, 2)
+
+    pygaul.set_cache_size(0)
+    pygaul.Names(admin="301")
+    assert pygaul.cache_info()["names"].currsize == 0
+
+
+def test_threads():
+    """Request the same areas from several threads."""
+    admins = ["301", "101", "105", "301"] * 25
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda a: pygaul.Names(admin=a).gaul0_code[0], admins))
+
+    assert results == admins
+    info = pygaul.cache_info()["names"]
+    assert info.hits + info.misses == len(admins)
+    assert info.currsize == 3
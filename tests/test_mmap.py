@@ -0,0 +1,49 @@
+"""Tests of the memory-mapped database."""
+
+from pathlib import Path
+
+import pytest
+
+import pygaul
+from pygaul import names
+
+
+@pytest.fixture
+def mmap_database(monkeypatch, tmp_path):
+    """Read the database from a memory-mapped file generated in a temporary cache directory."""
+    monkeypatch.setenv("PYGAUL_MMAP", "1")
+    monkeypatch.setenv("PYGAUL_CACHE_DIR", str(tmp_path))
+    pygaul.get_store().clear()
+    yield tmp_path
+    monkeypatch.undo()
+    pygaul.get_store().clear()
+
+
+def test_generated(mmap_database):
+    """Check that the Arrow file is generated in the cache directory on first use."""
+    df = names._df()
+    assert len(list(mmap_database.glob("gaul_database-*.arrow"))) == 1
+    expected = names._read_parquet()
+    for column in expected.columns:
+        assert names._str(df[column]).equals(names._str(expected[column]))
+
+
+@pytest.mark.skipif(not Path("/proc/self/maps").exists(), reason="needs the Linux memory maps")
+def test_file_backed(mmap_database):
+    """Check that the columns wrap the pages of the mapped file instead of a copy in the heap."""
+    df = names._df()
+    file = str(next(mmap_database.glob("gaul_database-*.arrow")))
+    lines = [line.split() for line in Path("/proc/self/maps").read_text().splitlines()]
+    ranges = [[int(a, 16) for a in line[0].split("-")] for line in lines if line[-1] == file]
+    assert ranges
+
+    for column in df.columns:
+        for chunk in df[column].array._pa_array.chunks:
+            for buffer in filter(None, chunk.buffers()):
+                assert any(start <= buffer.address < end for start, end in ranges)
+
+
+def test_names(mmap_database, dataframe_regression):
+    """Request the complete hierarchy of an area from the memory-mapped database."""
+    df = pygaul.Names(name="Singapore", content_level=1, complete=True)
+    dataframe_regression.check(df)
@@ -66,6 +66,13 @@ def test_case_insensitive():
     assert df1.equals(df2)
 
 
+def test_accent_insensitive():
+    """Request an area without its accents and punctuation."""
+    for name in ["Cote d'Ivoire", "COTE D IVOIRE", " côte-d\u2019ivoire "]:
+        df = pygaul.Names(name=name)
+        assert df.to_dict("records") == [{"gaul0_name": "Côte D'Ivoire", "gaul0_code": "117"}]
+
+
 def test_suggestions():
     """Test that when a wrong name is given 5 options are proposed in the error message."""
     expected_error = 'The requested "Franc" is not part of FAO GAUL 2024. The closest matches are: France, Franca, Ranco, Franciou, Rancul.'
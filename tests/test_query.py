@@ -0,0 +1,30 @@
+"""Tests of the parquet query layer."""
+
+import pyarrow.parquet as pq
+
+import pygaul
+from pygaul import names
+
+
+def test_layout():
+    """The database is split in row groups sorted by continent and country."""
+    metadata = pq.ParquetFile(pygaul.__gaul_data__).metadata
+    assert metadata.num_row_groups > 1
+
+    bounds = [metadata.row_group(i).column(0).statistics for i in range(metadata.num_row_groups)]
+    assert all(a.max <= b.min for a, b in zip(bounds[:-1], bounds[1:]))
+
+
+def test_query():
+    """Read the lines of some countries in the order of the database."""
+    df = names._query(["gaul0_code", "gaul1_name"], continent=["Europe"], country=[301, "312"])
+    full = names._df()
+    expected = full[full.gaul0_code.isin([301, 312])][["gaul0_code", "gaul1_name"]]
+    assert df.astype(str).equals(expected.astype(str))
+
+
+def test_query_level():
+    """Read only the lines including an area of a level."""
+    df = names._query(["gaul2_code"], level=2, compact=False)
+    assert (df.gaul2_code != "").all()
+    assert df.index.equals(names._df().index[names._df().gaul2_code.notna()])
@@ -0,0 +1,73 @@
+"""Tests of the ``resolve`` function."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import pygaul
+
+
+def test_duplicate_input():
+    """Request with too many parameters."""
+    with pytest.raises(Exception):
+        pygaul.resolve(name=["Singapore"], admin=["222"])
+
+
+def test_names(dataframe_regression):
+    """Request a list of names from different levels."""
+    df = pygaul.resolve(name=["France", "corse-du-sud", "t0t0", "Ang Mo Kio-Cheng San", "Salem"])
+    dataframe_regression.check(df)
+
+
+def test_admins(dataframe_regression):
+    """Request a numpy array of admin codes."""
+    df = pygaul.resolve(admin=np.array([301, 2968, 135345]))
+    dataframe_regression.check(df)
+
+
+def test_series_index():
+    """Check that the index of a Series is kept."""
+    names = pd.Series(["France", "Singapore"], index=["a", "b"])
+    df = pygaul.resolve(name=names)
+    assert df.index.to_list() == ["a", "b"]
+    assert df.gaul0_code.to_list() == ["301", "269"]
+
+
+def test_folded():
+    """Identify names written without their accents and punctuation."""
+    df = pygaul.resolve(name=["Cote d'Ivoire", "sao paulo", "Ang Mo Kio Cheng San", "Franc"])
+    assert df.status.to_list() == ["found", "found", "found", "not found"]
+    assert df.gaul0_name.to_list()[:3] == ["Côte D'Ivoire", "Brazil", "Singapore"]
+    assert df.gaul1_name[1] == "São Paulo"
+
+
+def test_strip():
+    """Identify the values with surrounding spaces like Names does."""
+    df = pygaul.resolve(admin=[" 301", "301 "])
+    assert df.status.to_list() == ["found", "found"]
+    assert df.gaul0_code.to_list() == ["301", "301"]
+    assert pygaul.resolve(name=[" france "]).gaul0_code[0] == "301"
+
+
+def test_missing():
+    """Never identify the missing values of a Series."""
+    df = pygaul.resolve(name=pd.Series([None, "France", "Singapore", np.nan]))
+    assert df.status.to_list() == ["not found", "found", "found", "not found"]
+    assert df.gaul0_name.to_list() == ["", "France", "Singapore", ""]
+
+
+def test_empty():
+    """Return an empty result for an empty request."""
+    df = pygaul.resolve(name=[])
+    assert len(df) == 0
+    assert df.columns[0] == "name"
+    assert pygaul.resolve(admin=pd.Series([], dtype=str)).columns[0] == "admin"
+
+
+def test_consistency():
+    """Check that the results are the same as the Names object."""
+    names = ["Singapore", "singaPORE", "Corse-du-Sud", "Bukit Timah"]
+    df = pygaul.resolve(name=names)
+    for name, line in zip(names, df.itertuples()):
+        names_df = pygaul.Names(name=name)
+        assert names_df.iloc[0, 1] == getattr(line, f"gaul{line.level}_code")
@@ -0,0 +1,119 @@
+"""Tests of the data store."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+import pytest
+
+import pygaul
+from pygaul import __gaul_data__, names
+
+
+@pytest.fixture
+def renamed(tmp_path):
+    """A copy of the database where France is renamed Francia."""
+    table = pq.read_table(__gaul_data__)
+    index = table.schema.get_field_index("gaul0_name")
+    column = table.column(index)
+    column = pc.if_else(pc.equal(column, "France"), "Francia", column)
+    file = tmp_path / "gaul_database.parquet"
+    pq.write_table(table.set_column(index, "gaul0_name", column), file)
+    return file
+
+
+def test_global():
+    """The requests use the global store by default."""
+    store = pygaul.get_store()
+    assert store is pygaul.get_store()
+    assert store.path == __gaul_data__
+
+
+def test_warm():
+    """Build the table and the indexes before the first request."""
+    store = pygaul.GaulStore()
+    with store.use():
+        assert not names._df.loaded()
+        assert not names._keys.loaded("gaul{}_name")
+
+    assert store.warm() is store
+    with store.use():
+        assert names._df.loaded()
+        assert names._keys.loaded("gaul{}_name")
+        assert names._tree.loaded()
+
+
+def test_single_load():
+    """Load the table once when the first requests are concurrent."""
+    store = pygaul.GaulStore()
+    pygaul.enable_stats()
+    pygaul.stats(reset=True)
+
+    def request(admin):
+        with store.use():
+            return pygaul.Names(admin=admin).gaul0_code[0]
+
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(request, ["301", "101", "105", "312"] * 4))
+        assert pygaul.stats()["pygaul.load"].count == 1
+    finally:
+        pygaul.enable_stats(False)
+        pygaul.stats(reset=True)
+
+    assert results == ["301", "101", "105", "312"] * 4
+
+
+def test_use(renamed):
+    """Request the areas of another database in a block of code."""
+    store = pygaul.GaulStore(renamed)
+    with store.use():
+        assert pygaul.Names(admin="301").gaul0_name[0] == "Francia"
+        assert pygaul.resolve(name=["Francia"]).status[0] == "found"
+        assert pygaul.Items(name="Francia")._codes == {0: [301]}
+
+    # the memo keeps the results of each store apart
+    assert pygaul.Names(admin="301").gaul0_name[0] == "France"
+    with pytest.raises(ValueError):
+        pygaul.Names(name="Francia")
+
+
+def test_reload(renamed):
+    """Swap the database of a store."""
+    store = pygaul.GaulStore()
+    with store.use():
+        assert pygaul.Names(admin="301").gaul0_name[0] == "France"
+
+        # the requests of a running block keep the data they started with
+        store.reload(renamed)
+        assert pygaul.Names(admin="301").gaul0_name[0] == "France"
+
+    assert store.path == renamed
+    with store.use():
+        assert names._df.loaded()
+        assert pygaul.Names(admin="301").gaul0_name[0] == "Francia"
+
+
+def test_reload_without_index(tmp_path):
+    """Reload a database written by pandas without its index column."""
+    file = tmp_path / "gaul_database.parquet"
+    pd.read_parquet(__gaul_data__).reset_index(drop=True).to_parquet(file)
+    assert "__index_level_0__" not in pq.read_schema(file).names
+
+    store = pygaul.GaulStore()
+    store.reload(file)
+    with store.use():
+        assert pygaul.Names(name="France", content_level=1).gaul1_code.str.len().gt(0).all()
+        assert pygaul.Names(content_level=0).gaul0_code.is_unique
+
+    with pygaul.GaulStore(file).use():
+        assert pygaul.Names(admin="301").gaul0_name[0] == "France"
+
+
+def test_clear():
+    """Drop the table and the indexes of a store."""
+    store = pygaul.GaulStore().warm()
+    store.clear()
+    with store.use():
+        assert not names._df.loaded()
@@ -0,0 +1,43 @@
+"""Tests of the ``suggest`` function."""
+
+from difflib import get_close_matches
+
+import pytest
+
+import pygaul
+
+
+def test_duplicate_input():
+    """Request with too many parameters."""
+    with pytest.raises(Exception):
+        pygaul.suggest(name="Singapore", admin="222")
+
+
+def test_name():
+    """Request the closest names of a misspelled name."""
+    assert pygaul.suggest(name="Franc") == ["France", "Franca", "Ranco", "Franciou", "Rancul"]
+    assert pygaul.suggest(name="Franc", n=2) == ["France", "Franca"]
+
+
+def test_n():
+    """Request no suggestion like difflib."""
+    with pytest.raises(ValueError, match="n must be > 0"):
+        pygaul.suggest(name="Franc", n=0)
+
+
+def test_admin():
+    """Request the closest codes of a wrong admin code."""
+    assert pygaul.suggest(admin="29680") == ["129680", "2980", "2968", "2960", "2680"]
+
+
+def test_no_match():
+    """Request a value that is close to nothing."""
+    assert pygaul.suggest(name="ñ∂") == []
+
+
+def test_difflib():
+    """Check that the suggestions are the same as the ones of difflib."""
+    ids = list(pygaul.names._index("gaul{}_name"))
+    for name in ["zambroski", "palo de faria", "setidia", "mauebisse"]:
+        expected = [i.capitalize() for i in get_close_matches(name, ids, n=5)]
+        assert pygaul.suggest(name=name) == expected
@@ -0,0 +1,74 @@
+"""Tests of the instrumentation hooks and statistics."""
+
+from contextlib import contextmanager
+
+import pytest
+
+import pygaul
+from pygaul import tracing
+from pygaul.download import download
+
+
+@pytest.fixture
+def spans():
+    """Record the spans of the lib with a hook and the statistics."""
+    recorded = []
+
+    @contextmanager
+    def hook(name, attributes):
+        recorded.append((name, attributes))
+        yield
+
+    pygaul.cache_clear()
+    pygaul.add_hook(hook)
+    pygaul.enable_stats()
+    pygaul.stats(reset=True)
+    yield recorded
+    pygaul.remove_hook(hook)
+    pygaul.enable_stats(False)
+    pygaul.stats(reset=True)
+
+
+def test_disabled():
+    """The spans are no-ops when nothing is enabled."""
+    assert tracing.span("test") is tracing.span("other")
+    pygaul.Names(name="France")
+    assert pygaul.stats() == {}
+
+
+def test_names(spans):
+    """Time the resolution of the names."""
+    pygaul.get_store().clear()
+    pygaul.Names(name="France", content_level=1)
+    assert ("pygaul.names", {"args": "France, , 1, False"}) in spans
+    assert ("pygaul.index.index", {"args": "gaul{}_name"}) in spans
+
+    stats = pygaul.stats()
+    assert stats["pygaul.names"].count == 1
+    assert stats["pygaul.names"].total <= stats["pygaul.names"].max + 1e-9
+
+    with pytest.raises(ValueError):
+        pygaul.Names(name="Franc")
+    assert pygaul.stats()["pygaul.suggest"].count == 1
+    assert pygaul.stats(reset=True)["pygaul.names"].count == 2
+    assert pygaul.stats() == {}
+
+
+def test_earth_engine(spans, fake_ee):
+    """Time the expressions and the Earth Engine calls."""
+    pygaul.Items(admin="301").getInfo()
+    assert "pygaul.items" in pygaul.stats()
+
+    download(2, list(range(100001, 100011)), chunk_size=5)
+    assert pygaul.stats()["pygaul.ee"].count == 2
+    assert ("pygaul.ee", {"level": 2, "codes": 5}) in spans
+
+
+def test_opentelemetry(spans):
+    """An OpenTelemetry tracer can be used as a hook."""
+    trace = pytest.importorskip("opentelemetry.trace")
+    tracer = trace.get_tracer("pygaul")
+    pygaul.add_hook(tracer.start_as_current_span)
+    pygaul.Names(name="Italy")
+    pygaul.remove_hook(tracer.start_as_current_span)
+    assert pygaul.stats()["pygaul.names"].count == 1